@@ -1,20 +1,46 @@
+"""
+About page texts and the licenses' registry.
+
+Licenses are kept as names and paths only; a license's text is read
+when it's displayed (see `license_text`).
+"""
+
+
+import collections
+import functools
 import os
 
-from main import APP_NAME
+
+# TODO find appropriate name
+APP_NAME = 'Free edu'
+
+_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_LICENSE_PATH = os.path.join(_DIR, 'LICENSE.txt')
+OTHER_LICENSES_DIR = os.path.join(_DIR, 'other_licenses')
 
 
-with open('LICENSE.txt') as _license_file:
-    _PROJECT_LICENCE = _license_file.read()
+def _license_name(file_name):
+    """eg. 'kivy_license.txt' to 'kivy'"""
+    return file_name.replace('_license.txt', '').replace('_', '')
 
-LICENSES_DCT = {APP_NAME: _PROJECT_LICENCE}
 
-OTHER_LICENSES_DIR = 'other_licenses'
-for _p in os.listdir(OTHER_LICENSES_DIR):
-    _file_path = os.path.join(OTHER_LICENSES_DIR, _p)
-    with open(_file_path) as _license_file:
-        _l = _license_file.read()
-        _name = _p.replace('_license.txt', '').replace('_', '')
-        LICENSES_DCT.update({_name: _l})
+@functools.lru_cache(maxsize=1)
+def license_paths():
+    """
+    Project's license first, then third parties' (listed on first call).
+
+    :return: (OrderedDict) {name: path}
+    """
+    dct = collections.OrderedDict([(APP_NAME, PROJECT_LICENSE_PATH)])
+    for file_name in sorted(os.listdir(OTHER_LICENSES_DIR)):
+        dct[_license_name(file_name)] = os.path.join(OTHER_LICENSES_DIR, file_name)
+    return dct
+
+
+def license_text(name):
+    """Reads the license (not kept in memory afterwards)."""
+    with open(license_paths()[name]) as license_file:
+        return license_file.read()
 
 
 EMAIL = 'FermiParadoxSo@gmail.com'
@@ -25,4 +51,3 @@ The rewards exist only for cosmetic purposes, and have no real currency value.''
 
 
 ABOUT_TEXT = '\n\n'.join([_CONTACT_ME, _DISCLAIMER, ])
-
@@ -9,8 +9,11 @@ eg. `type(sympify('1/3'))` is `Pow`
 """
 
 
+import functools
+import itertools
 import re
 import operator
+from fractions import Fraction
 
 
 from arbitrary_pieces import print_delimiter
@@ -23,17 +26,67 @@ _MAYBE_PLUS_OR_MINUS_PATT = _PLUS_OR_MINUS_PATT + '?'
 PATTERNS = []
 
 
+_ALLOWED_OCCURRENCE_STR_OPS = {
+    r'==': operator.eq,
+    r'!=': operator.ne,
+    r'>': operator.gt,
+    r'>=': operator.ge,
+    r'<': operator.lt,
+    r'<=': operator.le,
+}
+# (longer ops first, so that '>=' isn't read as '>')
+_OCCURRENCE_OPS_PATT = '|'.join(sorted(_ALLOWED_OCCURRENCE_STR_OPS, key=len, reverse=True))
+# eg. 'm>2', '2<=m<3'
+_BOUNDS_STR_REGEX = re.compile(r'(?:(\d+)({ops}))?m({ops})(\d+)'.format(ops=_OCCURRENCE_OPS_PATT))
+
+
+class BoundsPredicate(object):
+    """
+    Bounds-string (eg. 'm>2', 'm!=3', '2<=m<3') parsed once,
+    called with the total matches found.
+    """
+
+    def __init__(self, bounds_str):
+        match = _BOUNDS_STR_REGEX.fullmatch(bounds_str)
+        if not match:
+            raise ValueError('Bounds-string {} not matching requirements.'.format(bounds_str))
+        num1, op1, op2, num2 = match.groups()
+        self.bounds_str = bounds_str
+        self._lower = None if num1 is None else (_ALLOWED_OCCURRENCE_STR_OPS[op1], int(num1))
+        self._upper = (_ALLOWED_OCCURRENCE_STR_OPS[op2], int(num2))
+        # Any number of matches above the numbers of the bounds leads to the same outcome.
+        self.max_relevant_m = max(int(num2), int(num1 or 0)) + 1
+
+    def __call__(self, m):
+        if self._lower is not None:
+            op1, num1 = self._lower
+            if not op1(num1, m):
+                return False
+        op2, num2 = self._upper
+        return op2(m, num2)
+
+    def __repr__(self):
+        return '{}({!r})'.format(type(self).__name__, self.bounds_str)
+
+
+@functools.lru_cache(maxsize=128)
+def bounds_predicate(bounds_str):
+    """Cached `BoundsPredicate` of given bounds-string."""
+    return BoundsPredicate(bounds_str)
+
+
+def _bounds_predicate_of(bounds):
+    if isinstance(bounds, BoundsPredicate):
+        return bounds
+    return bounds_predicate(bounds)
+
+
 class _PatternBase(str):
-    _ALLOWED_OCCURRENCE_STR_OPS = {
-        r'==': operator.eq,
-        r'!=': operator.ne,
-        r'>': operator.gt,
-        r'>=': operator.ge,
-        r'<': operator.lt,
-        r'<=': operator.le,
-    }
 
-    with_sign = ''  # (added here simply for static analysis by IDE)
+    # (added here simply for static analysis by IDE)
+    with_sign = ''
+    compiled = re.compile('')
+    with_sign_compiled = re.compile('')
 
     def __new__(cls, compile_obj, fullmatch, no_fullmatch, two_matches, **kwargs):
         """String that can be used by `re` module as pattern
@@ -63,7 +116,12 @@ class _PatternBase(str):
                                                   two_matches=two_matches)
 
         inst = str.__new__(cls, patt)
-        inst.__dict__.update({'with_sign': _MAYBE_PLUS_OR_MINUS_PATT + inst})
+        with_sign = _MAYBE_PLUS_OR_MINUS_PATT + inst
+        inst.__dict__.update({'with_sign': with_sign})
+        # Precompiled, so that hot paths don't go through `re`'s cache.
+        inst.__dict__.update(dict(
+            compiled=compile_obj,
+            with_sign_compiled=re.compile(with_sign, compile_obj.flags)))
         inst.__dict__.update(dict(
             fullmatch=fullmatch,
             no_fullmatch=no_fullmatch,
@@ -96,23 +154,10 @@ class _PatternBase(str):
         :param m: Total bounds found.
         :param bounds_str: Expresses bounds of total matches found (must contain 'm').
             eg. 'm>2', 'm!=3', '2<=m<3'
+            (a `BoundsPredicate` is accepted as well)
         :return: (bool)
         """
-        for k in _PatternBase._ALLOWED_OCCURRENCE_STR_OPS:
-            match = re.fullmatch('m({})(\d+)'.format(k), bounds_str)
-            if match:
-                op, num = match.group(1), int(match.group(2))
-                return _PatternBase._ALLOWED_OCCURRENCE_STR_OPS[op](m, num)
-        for k1 in _PatternBase._ALLOWED_OCCURRENCE_STR_OPS:
-            for k2 in _PatternBase._ALLOWED_OCCURRENCE_STR_OPS:
-                match = re.fullmatch('(\d+)({k1})m({k2})(\d+)'.format(k1=k1, k2=k2), bounds_str)
-                if match:
-                    num1, op1, op2, num2 = int(match.group(1)), match.group(2), match.group(3), int(match.group(4))
-                    within_1st_bound = _PatternBase._ALLOWED_OCCURRENCE_STR_OPS[op1](num1, m)
-                    within_2nd_bound = _PatternBase._ALLOWED_OCCURRENCE_STR_OPS[op2](m, num2)
-                    return within_1st_bound and within_2nd_bound
-        else:
-            raise ValueError('Bounds-string {} not matching requirements.'.format(bounds_str))
+        return _bounds_predicate_of(bounds_str)(m)
 
     @staticmethod
     def _check_duplicates_and_note_new_pattern(pattern):
@@ -124,13 +169,38 @@ class _PatternBase(str):
 
     @staticmethod
     def found_m_patterns(compile_obj, expr, bounds_str):
-        matches = re.findall(compile_obj, expr)
-        return _PatternBase.total_matches_within_bounds(m=len(matches), bounds_str=bounds_str)
+        """
+        Checks if the matches of the pattern in `expr` are within bounds.
+
+        Stops searching as soon as further matches can't change the outcome.
+
+        :param bounds_str: Bounds-string (eg. 'm>2') or `BoundsPredicate`.
+        """
+        predicate = _bounds_predicate_of(bounds_str)
+        matches = itertools.islice(re.finditer(compile_obj, expr), predicate.max_relevant_m)
+        return predicate(sum(1 for _ in matches))
 
 
 found_m_patterns = _PatternBase.found_m_patterns
 
 
+def any_fullmatch_validator(patterns, flags=0):
+    """
+    Merges patterns into a single compiled alternation.
+
+    `validator.fullmatch(s)` matches if (and only if) any of the patterns fullmatches `s`.
+
+    :param patterns: Pattern strings (eg. `INTEGER.with_sign`) or compiled patterns.
+    :param flags: `re` flags of the alternation (eg. `re.ASCII`).
+    :return: (re.Pattern) Never matches if there are no patterns.
+    """
+    patterns_strs = [getattr(p, 'pattern', p) for p in patterns]
+    if not patterns_strs:
+        # (an empty alternation would match the empty string)
+        return re.compile(r'(?!)', flags)
+    return re.compile('|'.join('(?:{})'.format(p) for p in patterns_strs), flags)
+
+
 # TEMPLATE
 """
 ? = _PatternBase(re.compile(r'\'),
@@ -164,6 +234,40 @@ FRACTION_OF_INTS_WITH_PARENTHESES = _PatternBase(
     two_matches=['1/3+4/20*0.1', '400/2-200/777', '(-10)/(+4)-4/20'])
 
 
+# Answers that are plain numbers (eg. '-2', '0.5', '+1/3').
+# (ASCII digits only; sympify doesn't accept other digits, eg. '٧')
+_NUMERIC_LITERAL_VALIDATOR = any_fullmatch_validator([INTEGER.with_sign,
+                                                      DECIMAL.with_sign,
+                                                      FRACTION_OF_INTS.with_sign],
+                                                     flags=re.ASCII)
+# Number starting with 0 followed by digits, eg. '007' (not a valid int for sympify, but '00.5' is).
+_LEADING_ZERO_REGEX = re.compile(r'(?<![0-9.])0[0-9]', re.ASCII)
+
+
+def numeric_literal_value(expr):
+    """
+    Exact value of a plain int, decimal or fraction of ints (eg. '-2', '0.5', '+1/3').
+
+    Used for bypassing sympify; the patterns guarantee the format,
+    so the value is built directly from the digits.
+    Numbers with leading zeros (eg. '007') are left to sympify.
+
+    :return: (Fraction) or None if `expr` is anything else (eg. '2+1', '1/0').
+    """
+    if (not _NUMERIC_LITERAL_VALIDATOR.fullmatch(expr)) or _LEADING_ZERO_REGEX.search(expr):
+        return None
+    if '/' in expr:
+        numerator, denominator = expr.split('/')
+        if int(denominator) == 0:
+            return None
+        return Fraction(int(numerator), int(denominator))
+    if '.' in expr:
+        # (sign, if any, remains in front of the digits, eg. '-0.5' -> -05/10)
+        integer_part, decimal_part = expr.split('.')
+        return Fraction(int(integer_part + decimal_part), 10 ** len(decimal_part))
+    return Fraction(int(expr))
+
+
 if __name__ == '__main__':
 
     print_delimiter()
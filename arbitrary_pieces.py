@@ -1,11 +1,15 @@
 import abc
+import bisect
+import functools
 import random
 import re
 import itertools
-import sympy
-from sympy.abc import x
-
 import languages
+from lazy_modules import LazyModule
+
+
+# (loaded on first use)
+sympy = LazyModule('sympy')
 
 
 # ---------------------------------------------------------------------------------
@@ -88,12 +92,120 @@ def class_children(cls):
     return s
 
 
+# ---------------------------------------------------------------------------------
+class _NumpyRandomAdapter(object):
+    """
+    Exposes the `random.Random` methods used by the project
+    on top of a NumPy `Generator`.
+    """
+
+    def __init__(self, generator):
+        self.generator = generator
+
+    def choice(self, seq):
+        return seq[int(self.generator.integers(len(seq)))]
+
+    def choices(self, population, cum_weights=None, k=1):
+        if cum_weights is None:
+            return [population[i] for i in self.generator.integers(len(population), size=k).tolist()]
+        total = cum_weights[-1]
+        return [population[bisect.bisect(cum_weights, r * total)] for r in self.generator.random(k).tolist()]
+
+    def randint(self, a, b):
+        return int(self.generator.integers(a, b, endpoint=True))
+
+    def shuffle(self, lst):
+        lst[:] = [lst[i] for i in self.generator.permutation(len(lst)).tolist()]
+
+
+def random_source(rng=None):
+    """
+    Object with `random.Random` methods (`choice`, `choices`, `randint`, `shuffle`).
+
+    :param rng: `random.Random`, NumPy `Generator` or None (module-level `random`).
+    """
+    if rng is None:
+        return random
+    # (NumPy isn't imported only for this check.)
+    if hasattr(rng, 'integers'):
+        return _NumpyRandomAdapter(rng)
+    return rng
+
+
 # ---------------------------------------------------------------------------------
 _ALLOWED_POS_NEG_0 = set('+-0')
 _MANDATORY_POS_NEG_0 = _ALLOWED_POS_NEG_0 - {'0'}
 
 
-def r_int(bounds, pos_neg_0='+-0', excluded=(), weights=None) -> int:
+class IntSampler(object):
+    """
+    Draws ints with the odds described by `r_int` args.
+
+    Candidates and their cumulative weights are calculated once,
+    so that draws cost a single bisection.
+    Use `int_sampler` to get a cached instance instead of creating new ones.
+    """
+
+    def __init__(self, bounds, pos_neg_0='+-0', excluded=(), weights=None):
+        if isinstance(bounds, int):
+            b1, b2 = -bounds, bounds
+        else:
+            # .. it's a tuple.
+            b1, b2 = bounds
+
+        if (not pos_neg_0) or (pos_neg_0 == '0'):
+            raise ValueError('Need at least one of the following: {}.'.format(_MANDATORY_POS_NEG_0))
+        extra_chars = set(pos_neg_0) - _ALLOWED_POS_NEG_0
+        if extra_chars:
+            raise ValueError('Only {} are allowed. Found: {}.'.format(_ALLOWED_POS_NEG_0, extra_chars))
+
+        excluded = set(excluded)
+        if '0' not in pos_neg_0:
+            excluded.add(0)
+        if '-' not in pos_neg_0:
+            b1 = max(b1, 0)
+        if '+' not in pos_neg_0:
+            b2 = min(b2, 0)
+        candidates = [i for i in range(b1, b2+1) if i not in excluded]
+
+        weights = weights or {}
+        for n, w in weights.items():
+            if n not in candidates:
+                raise ValueError("Can't provide weight for number that is out of the bounds ({}).".format(n))
+            if (w <= 0) or (not isinstance(w, int)):
+                raise ValueError('Weight must be positive int.')
+
+        # (Easier to understand error compared to `choice`'s error.)
+        if not candidates:
+            raise ValueError('No number exists for given args.')
+        self.candidates = tuple(candidates)
+        self.weights = tuple(weights.get(n, 1) for n in candidates)
+        self.cum_weights = tuple(itertools.accumulate(self.weights))
+
+    def draw(self, rng=None) -> int:
+        return self.sample(1, rng=rng)[0]
+
+    def sample(self, k, rng=None) -> list:
+        """Return `k` ints (drawn independently)."""
+        return random_source(rng).choices(self.candidates, cum_weights=self.cum_weights, k=k)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_int_sampler(bounds, pos_neg_0, excluded, weights):
+    return IntSampler(bounds=bounds, pos_neg_0=pos_neg_0, excluded=excluded, weights=dict(weights))
+
+
+def int_sampler(bounds, pos_neg_0='+-0', excluded=(), weights=None):
+    """
+    Cached `IntSampler` for given `r_int` args.
+    """
+    return _cached_int_sampler(bounds=bounds if isinstance(bounds, int) else tuple(bounds),
+                               pos_neg_0=pos_neg_0,
+                               excluded=frozenset(excluded),
+                               weights=tuple(sorted(weights.items())) if weights else ())
+
+
+def r_int(bounds, pos_neg_0='+-0', excluded=(), weights=None, rng=None) -> int:
     """
     Return random integer within bounds, excluding a list of ints.
 
@@ -119,49 +231,27 @@ def r_int(bounds, pos_neg_0='+-0', excluded=(), weights=None) -> int:
     :param weights: Weights of individual numbers (each number has `weight = 1` by default)
         To calculate the odds of a number appearing,
         divide its weight by the total weights of all numbers.
+    :param rng: `random.Random` or NumPy `Generator` (defaults to module-level `random`).
     """
-    if isinstance(bounds, int):
-        b1, b2 = -bounds, bounds
-    else:
-        # .. it's a tuple.
-        b1, b2 = bounds
-
-    if (not pos_neg_0) or (pos_neg_0 == '0'):
-        raise ValueError('Need at least one of the following: {}.'.format(_MANDATORY_POS_NEG_0))
-    extra_chars = set(pos_neg_0) - _ALLOWED_POS_NEG_0
-    if extra_chars:
-        raise ValueError('Only {} are allowed. Found: {}.'.format(_ALLOWED_POS_NEG_0, extra_chars))
-
-    nums = set(range(b1, b2+1)) - set(excluded)
-    if '0' not in pos_neg_0:
-        nums -= {0}
-    if '-' not in pos_neg_0:
-        nums = {i for i in nums if not i < 0}
-    if '+' not in pos_neg_0:
-        nums = {i for i in nums if not i > 0}
-    nums_lst = list(nums)
-
-    if weights:
-        for n, w in weights.items():
-            if n not in nums_lst:
-                raise ValueError("Can't provide weight for number that is out of the bounds ({}).".format(n))
-            if (w <= 0) or (not isinstance(w, int)):
-                raise ValueError('Weight must be positive int.')
-            nums_lst.extend(itertools.repeat(n, w-1))
+    return int_sampler(bounds=bounds, pos_neg_0=pos_neg_0, excluded=excluded, weights=weights).draw(rng=rng)
 
-    # (Easier to understand error compared to `choice`'s error.)
-    if not nums_lst:
-        raise ValueError('No number exists for given args.')
-    return random.choice(nums_lst)
+
+def r_ints(k, bounds, pos_neg_0='+-0', excluded=(), weights=None, rng=None) -> list:
+    """
+    Return `k` random integers (same odds as `r_int`), all drawn at once.
+
+    >>> r_ints(3, 10, '+-')
+    """
+    return int_sampler(bounds=bounds, pos_neg_0=pos_neg_0, excluded=excluded, weights=weights).sample(k, rng=rng)
 
 
 # ---------------------------------------------------------------------------------
-def sometimes_replace_1x_with_x(expr, var_name):
+def sometimes_replace_1x_with_x(expr, var_name, rng=None):
     """
     Half of the time converts "1x" to "x".
     "31x", "461x", "4.1x", etc will always remain the same.
     """
-    if random.choice([0, 1]):
+    if random_source(rng).choice([0, 1]):
         expr = re.sub(r'(?<![0-9.])1{}'.format(var_name), r'{}'.format(var_name), expr)
     return expr
 
@@ -182,21 +272,29 @@ def solve_1rst_degree_poly(expr):
     elif eq is sympy.sympify(False):
         return NoSolution
     else:
-        return sympy.solve(eq, x)[0]
+        return sympy.solve(eq, sympy.Symbol('x'))[0]
 
 
 # --------------------------------------------------------------------------------------------------------
-# Escaped `re` special chars.
-_re_compatible_op_symbols = ('\+', '-', '/', '\*')
+# Any two of '+-/*' next to each other.
+_CONSECUTIVE_OPERATORS_REGEX = re.compile(r'[-+/*]{2}')
 
 
 def consecutive_operators_search(expr):
-    patterns = itertools.product(_re_compatible_op_symbols, repeat=2)
-    for t in patterns:
-        pat = '{}{}'.format(*t)
-        found = re.search(pat, expr)
-        if found:
-            return found
+    """
+    :return: The match of the first consecutive operators found in `expr` (or None).
+    """
+    return _CONSECUTIVE_OPERATORS_REGEX.search(expr)
+
+
+def consecutive_operators_search_many(expressions):
+    """
+    `consecutive_operators_search` of each expression.
+
+    :return: (list) of matches (or None)
+    """
+    search = _CONSECUTIVE_OPERATORS_REGEX.search
+    return [search(expr) for expr in expressions]
 
 
 # ---------------------------------------------------------------------------------
@@ -249,7 +347,13 @@ class NoSolution(SpecialAnswerType):
 SPECIAL_ANSWERS_TYPES = tuple(class_children(SpecialAnswerType))
 
 
-SYMPY_ANSWERS_TYPES = tuple(i for i in dir(sympy.Q) if not i.startswith('_'))
+def __getattr__(name):
+    # `SYMPY_ANSWERS_TYPES` is created on first access, since it needs sympy.
+    if name == 'SYMPY_ANSWERS_TYPES':
+        value = tuple(i for i in dir(sympy.Q) if not i.startswith('_'))
+        globals()[name] = value
+        return value
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
 
 
 if __name__ == '__main__':
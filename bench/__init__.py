@@ -0,0 +1,3 @@
+"""
+Benchmarks of exercise generation and grading (`python -m bench.run --help`).
+"""
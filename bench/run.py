@@ -0,0 +1,254 @@
+"""
+Standalone benchmark runner.
+
+Each benchmark calls a function once per pre-generated input (inputs follow the
+distributions the app actually produces) and records throughput and p50/p99 latency.
+Results are saved as JSON, so runs of different commits can be compared:
+
+    python -m bench.run --json before.json
+    (.. changes ..)
+    python -m bench.run --json after.json --compare before.json
+"""
+
+
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+
+import check_tracing
+from arbitrary_pieces import SPECIAL_ANSWERS_TYPES, consecutive_operators_search, r_int
+from exercises import Exercise, SolveForXLinear
+from linear_equation import COEFFICIENT_DRAWS
+
+
+DEFAULT_N = 2000
+DEFAULT_SEED = 0
+
+
+def percentile(sorted_values, q):
+    """
+    Nearest-rank percentile.
+
+    :param sorted_values: Ascending values.
+    :param q: (float) in [0, 100]
+    """
+    if not sorted_values:
+        raise ValueError('No values.')
+    rank = max(1, -(-len(sorted_values) * q // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def latency_stats(durations):
+    """
+    :param durations: Seconds of each call.
+    :return: (dict) Throughput (calls per sec) and latencies in microseconds.
+    """
+    values = sorted(durations)
+    total = sum(values)
+    return {
+        'n': len(values),
+        'throughput_per_s': len(values) / total if total else float('inf'),
+        'mean_us': total / len(values) * 1e6,
+        'p50_us': percentile(values, 50) * 1e6,
+        'p99_us': percentile(values, 99) * 1e6,
+    }
+
+
+def measure(func, inputs):
+    """
+    Calls `func(*args)` for each args-tuple of `inputs`, timing each call.
+    (An untimed call with the first input precedes them, so that lazy imports aren't measured.)
+
+    :return: (dict) `latency_stats` of the calls.
+    """
+    inputs = list(inputs)
+    if inputs:
+        func(*inputs[0])
+    durations = []
+    perf_counter = time.perf_counter
+    for args in inputs:
+        start = perf_counter()
+        func(*args)
+        durations.append(perf_counter() - start)
+    return latency_stats(durations)
+
+
+# ------------------------------------------------------------------------------------------
+# Realistic inputs
+
+def _answer_variants(solution, rng):
+    """Answers students give to an exercise: correct ones in several forms, wrong ones and invalid ones."""
+    if solution in SPECIAL_ANSWERS_TYPES:
+        return [solution, rng.choice(SPECIAL_ANSWERS_TYPES), str(r_int(10, rng=rng))]
+    variants = [str(solution), str(solution + r_int(3, '+', rng=rng)), '{}+x'.format(solution.numerator)]
+    if solution.denominator != 1:
+        variants.append('{:.3f}'.format(float(solution)))
+    return variants
+
+
+def _exercises(n, rng, difficulties=(1, 2, 3)):
+    return [SolveForXLinear(difficulty=rng.choice(difficulties), rng=rng) for _ in range(n)]
+
+
+def _submissions(n, rng):
+    """:return: (list) of `(exercise, answers-dict)`"""
+    lst = []
+    for inst in _exercises(max(1, n // 4), rng):
+        for answer in _answer_variants(inst.expected_answers['x'], rng):
+            lst.append((inst, {'x': answer}))
+    rng.shuffle(lst)
+    return lst[:n]
+
+
+# ------------------------------------------------------------------------------------------
+# Benchmarks: name -> function(n, rng) returning `measure(..)` results.
+
+def _bench_construction(difficulty):
+    def bench(n, rng):
+        return measure(lambda: SolveForXLinear(difficulty=difficulty, rng=rng), [()] * n)
+    return bench
+
+
+def bench_r_int(n, rng):
+    # (args of all `r_int` calls of `SolveForXLinear.random_equation`)
+    call_args = [((bounds, pos_neg_0), {'weights': weights} if weights else {})
+                 for draws in COEFFICIENT_DRAWS.values() for bounds, pos_neg_0, weights in draws]
+    inputs = [rng.choice(call_args) + (rng,) for _ in range(n)]
+    return measure(lambda args, kwargs, r: r_int(*args, rng=r, **kwargs), inputs)
+
+
+def bench_consecutive_operators_search(n, rng):
+    expressions = [inst.question for inst in _exercises(n // 2, rng)]
+    expressions += [str(answers['x']) for _, answers in _submissions(n - len(expressions), rng)]
+    return measure(consecutive_operators_search, [(e,) for e in expressions])
+
+
+def bench_is_valid_answer(n, rng):
+    submissions = _submissions(n, rng)
+    return measure(lambda inst, answer: inst._is_valid_answer(answer),
+                   [(inst, answers['x']) for inst, answers in submissions
+                    if answers['x'] not in SPECIAL_ANSWERS_TYPES])
+
+
+def bench_check_all_answers(n, rng):
+    return measure(lambda inst, answers: inst._check_all_answers(answers=answers,
+                                                                 expected_answers=inst.expected_answers),
+                   _submissions(n, rng))
+
+
+def bench_grade_many_classroom(n, rng):
+    """A classroom of 40 students submitting answers to the same exercise."""
+    inputs = []
+    for inst in _exercises(max(1, n // 40), rng):
+        answers = [{'x': a} for a in _answer_variants(inst.expected_answers['x'], rng)]
+        inputs.append((inst, [rng.choice(answers) for _ in range(40)]))
+    return measure(lambda inst, submissions: inst.grade_many(submissions), inputs)
+
+
+def bench_check_stages(n, rng):
+    """
+    `check_all_answers` with a `RingBufferCollector` observer;
+    adds latency stats of each stage (validation, sympify, comparison).
+    """
+    collector = check_tracing.RingBufferCollector(maxlen=n)
+    Exercise.add_check_observer(collector)
+    try:
+        results = measure(lambda inst, answers: inst.check_all_answers(answers), _submissions(n, rng))
+    finally:
+        Exercise.remove_check_observer(collector)
+    results['stages'] = {stage: latency_stats(collector.stage_times(stage)) for stage in check_tracing.STAGES}
+    return results
+
+
+BENCHMARKS = {
+    'construction_difficulty_1': _bench_construction(1),
+    'construction_difficulty_2': _bench_construction(2),
+    'construction_difficulty_3': _bench_construction(3),
+    'r_int': bench_r_int,
+    'consecutive_operators_search': bench_consecutive_operators_search,
+    '_is_valid_answer': bench_is_valid_answer,
+    '_check_all_answers': bench_check_all_answers,
+    'grade_many_classroom': bench_grade_many_classroom,
+    'check_stages': bench_check_stages,
+}
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(names=None, n=DEFAULT_N, seed=DEFAULT_SEED):
+    """
+    :param names: Benchmarks to run (defaults to all of `BENCHMARKS`).
+    :param n: Number of calls of each benchmark.
+    :param seed: Seed of the inputs (same seed, same inputs).
+    :return: (dict) JSON-serializable results.
+    """
+    names = list(BENCHMARKS) if names is None else names
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        raise ValueError('Unknown benchmarks: {}'.format(sorted(unknown)))
+    return {
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'n': n,
+        'seed': seed,
+        'results': {name: BENCHMARKS[name](n, random.Random('{}-{}'.format(seed, name))) for name in names},
+    }
+
+
+def compare(results, baseline_results):
+    """
+    :return: (dict) {benchmark name: p50 ratio (current / baseline)} of benchmarks present in both.
+    """
+    ratios = {}
+    for name, stats in results['results'].items():
+        baseline_stats = baseline_results['results'].get(name)
+        if baseline_stats:
+            ratios[name] = stats['p50_us'] / baseline_stats['p50_us']
+    return ratios
+
+
+def _print_results(results, ratios=None):
+    print('{:<32}{:>14}{:>12}{:>12}{:>10}'.format('benchmark', 'calls/s', 'p50 (us)', 'p99 (us)', 'vs base'))
+    for name, stats in results['results'].items():
+        ratio = '' if not ratios or name not in ratios else '{:.2f}x'.format(ratios[name])
+        print('{:<32}{:>14.0f}{:>12.1f}{:>12.1f}{:>10}'.format(name, stats['throughput_per_s'],
+                                                              stats['p50_us'], stats['p99_us'], ratio))
+        for stage, stage_stats in stats.get('stages', {}).items():
+            print('{:<32}{:>14}{:>12.1f}{:>12.1f}'.format('  ' + stage, '', stage_stats['p50_us'],
+                                                         stage_stats['p99_us']))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('names', nargs='*', help='Benchmarks to run (default: all). One of: {}'.format(
+        ', '.join(BENCHMARKS)))
+    parser.add_argument('-n', type=int, default=DEFAULT_N, help='Calls per benchmark.')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--json', help='Saves results to this file.')
+    parser.add_argument('--compare', help='Results file of a previous run (eg. of another commit).')
+    args = parser.parse_args(argv)
+
+    results = run(names=args.names or None, n=args.n, seed=args.seed)
+    ratios = None
+    if args.compare:
+        with open(args.compare) as f:
+            ratios = compare(results, json.load(f))
+    _print_results(results, ratios)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+    return results
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,68 @@
+"""
+Structured events of answer checks, sent to observers registered with `Exercise.add_check_observer`.
+
+Example:
+>>> collector = RingBufferCollector(maxlen=500)
+>>> Exercise.add_check_observer(collector)
+>>> ..
+>>> max(collector, key=lambda e: e.timings['sympify'])     # slowest sympify
+"""
+
+
+import collections
+import time
+
+
+# Stages of a check, in the order they run for each answer.
+VALIDATION = 'validation'
+SYMPIFY = 'sympify'
+COMPARISON = 'comparison'
+STAGES = (VALIDATION, SYMPIFY, COMPARISON)
+
+
+CheckEvent = collections.namedtuple('CheckEvent', ['exercise_id', 'exercise_class', 'question',
+                                                   'answers', 'timings', 'total', 'verdict'])
+CheckEvent.__doc__ = """
+One `Exercise.check_all_answers` (or one submission of `grade_many`).
+
+`timings` are the seconds spent on each stage (summed over all answers), `total` the seconds of the whole check.
+"""
+
+
+class StageTimings(dict):
+    """Seconds spent on each stage."""
+
+    def __init__(self):
+        super().__init__((stage, 0.) for stage in STAGES)
+
+    def add(self, stage, start):
+        """
+        :param start: `time.perf_counter()` value at the start of the stage.
+        """
+        self[stage] += time.perf_counter() - start
+
+
+class RingBufferCollector(object):
+    """
+    Observer keeping the latest `maxlen` events.
+    """
+
+    def __init__(self, maxlen=1000):
+        self._events = collections.deque(maxlen=maxlen)
+
+    def __call__(self, event):
+        self._events.append(event)
+
+    def __len__(self):
+        return len(self._events)
+
+    def __iter__(self):
+        # (copy, so that checks on other threads can continue while iterating)
+        return iter(list(self._events))
+
+    def clear(self):
+        self._events.clear()
+
+    def stage_times(self, stage):
+        """:return: (list) Seconds of `stage` of each collected event."""
+        return [e.timings[stage] for e in self]
@@ -0,0 +1,107 @@
+"""
+Every equation of the low difficulties of `SolveForXLinear`, precomputed.
+
+On difficulties 1 and 2 the equation `a*x+b=0` is defined by just two small ints,
+so all of them (along with their question, latex and solution) fit in a small table.
+Picking an equation is then a single weighted random index into the table
+(weights are those of the original `r_int` draws, so the odds stay the same).
+
+Tables are built on first use (about 1.4 ms for difficulty 2) and kept for the rest of the process.
+"""
+
+
+import collections
+import itertools
+
+from arbitrary_pieces import random_source
+from linear_equation import (B_TIMES_A_DIFFICULTIES, LinearEquation, coefficient_samplers, question_and_latex,
+                             solution_of_coefficients)
+
+
+TABLE_DIFFICULTIES = (1, 2)
+
+
+TableRow = collections.namedtuple('TableRow', ['a', 'b', 'weight', 'question', 'question_in_latex', 'solution'])
+TableRow.__doc__ = """Equation `a*x+b=0`; `weight` is proportional to its odds of being picked."""
+
+
+def table_coefficients(difficulty):
+    """
+    :return: (list) `(a, b, weight)` of every equation of `difficulty`.
+    """
+    if difficulty not in TABLE_DIFFICULTIES:
+        raise ValueError('No table for difficulty {}.'.format(difficulty))
+    a_sampler, second_sampler = coefficient_samplers(difficulty)
+    multiplied = difficulty in B_TIMES_A_DIFFICULTIES
+    lst = []
+    for (a, a_w), (n, n_w) in itertools.product(zip(a_sampler.candidates, a_sampler.weights),
+                                                zip(second_sampler.candidates, second_sampler.weights)):
+        lst.append((a, n * a if multiplied else n, a_w * n_w))
+    return lst
+
+
+class EquationTable(object):
+    """
+    Example:
+    >>> t = table(difficulty=2)
+    >>> t.random_equation()     # LinearEquation
+    >>> t.row(a=-3, b=0)        # TableRow
+    """
+
+    def __init__(self, difficulty, rows, var_name='x'):
+        self.difficulty = difficulty
+        self.var_name = var_name
+        self.rows = tuple(rows)
+        self.cum_weights = tuple(itertools.accumulate(r.weight for r in self.rows))
+        self._indices = range(len(self.rows))
+        self._index_of = {(r.a, r.b): i for i, r in enumerate(self.rows)}
+        # (created on first pick)
+        self._equations = [None] * len(self.rows)
+
+    def __len__(self):
+        return len(self.rows)
+
+    @classmethod
+    def build(cls, difficulty, var_name='x'):
+        rows = []
+        for a, b, weight in table_coefficients(difficulty):
+            question, question_in_latex = question_and_latex(((a, True), (b, False)), (), var_name=var_name)
+            rows.append(TableRow(a=a, b=b, weight=weight, question=question, question_in_latex=question_in_latex,
+                                 solution=solution_of_coefficients(a, b)))
+        return cls(difficulty=difficulty, rows=rows, var_name=var_name)
+
+    def row(self, a, b):
+        """:return: (TableRow) of `a*x+b=0`"""
+        return self.rows[self._index_of[(a, b)]]
+
+    def equation(self, index):
+        """:return: (LinearEquation) of row `index` (the same object on every call)."""
+        eq = self._equations[index]
+        if eq is None:
+            r = self.rows[index]
+            eq = self._equations[index] = LinearEquation(left_terms=((r.a, True), (r.b, False)), right_terms=(),
+                                                         var_name=self.var_name)
+        return eq
+
+    def random_equation(self, rng=None):
+        """
+        :param rng: `random.Random` or NumPy `Generator` (defaults to module-level `random`).
+        :return: (LinearEquation)
+        """
+        return self.equation(random_source(rng).choices(self._indices, cum_weights=self.cum_weights)[0])
+
+
+_TABLES = {}
+
+
+def table(difficulty, var_name='x'):
+    """
+    Table of `difficulty`, built once per process.
+
+    :return: (EquationTable)
+    """
+    key = (difficulty, var_name)
+    t = _TABLES.get(key)
+    if t is None:
+        t = _TABLES[key] = EquationTable.build(difficulty=difficulty, var_name=var_name)
+    return t
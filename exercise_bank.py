@@ -0,0 +1,226 @@
+"""
+Storage of many `SolveForXLinear` exercises as a single NumPy structured array.
+
+A bank is saved as an (uncompressed) `.npz` file holding the array and the variable name.
+The array can be loaded memory-mapped; processes loading the same file share its pages
+read-only (no copies), and individual exercises are rebuilt only when requested.
+"""
+
+
+import os
+import struct
+import zipfile
+from fractions import Fraction
+
+import numpy
+import numpy.lib.format
+
+import exercise_batches
+from arbitrary_pieces import AnyNumber, NoSolution
+from exercises import SolveForXLinear, SolveForXLinearRecord
+
+
+# Values of `solution_kind` field.
+NUMBER_SOLUTION = 0
+ANY_NUMBER_SOLUTION = 1
+NO_SOLUTION = 2
+
+
+def bank_dtype(max_terms):
+    """
+    Dtype of a bank's array; terms are stored in the order they are displayed
+    (left side terms first), padded up to `max_terms`.
+    """
+    return numpy.dtype([
+        ('difficulty', 'i1'),
+        ('terms_n', 'i2'),
+        ('left_terms_n', 'i2'),
+        ('coefficients', 'i4', (max_terms,)),
+        ('has_x', '?', (max_terms,)),
+        ('solution_kind', 'i1'),
+        ('solution_numerator', 'i8'),
+        ('solution_denominator', 'i8'),
+    ])
+
+
+def _bank_path(path):
+    """`path` ending in '.npz' (`numpy.savez` adds it if missing, so loading must too)."""
+    path = os.fspath(path)
+    return path if path.endswith('.npz') else path + '.npz'
+
+
+def _memmap_npz_member(path, name):
+    """
+    Memory-maps (read-only) an array stored uncompressed in a `.npz` file (as `numpy.savez` stores them).
+
+    :param name: Name of the member, eg. 'array.npy'.
+    :return: (numpy.memmap)
+    """
+    with zipfile.ZipFile(path) as zf:
+        info = zf.getinfo(name)
+    if info.compress_type != zipfile.ZIP_STORED:
+        raise ValueError("{} of {} is compressed; it can't be memory-mapped.".format(name, path))
+    with open(path, 'rb') as f:
+        # (local file header: 30 bytes, ending with the lengths of the member name and the extra field)
+        f.seek(info.header_offset)
+        name_len, extra_len = struct.unpack('<HH', f.read(30)[26:30])
+        f.seek(info.header_offset + 30 + name_len + extra_len)
+        version = numpy.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = numpy.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = numpy.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+    return numpy.memmap(path, dtype=dtype, mode='r', shape=shape, order='F' if fortran_order else 'C',
+                        offset=offset)
+
+
+def _fill_solutions(array):
+    """
+    Vectorized `solution_of_coefficients` of all rows,
+    stored as kind, numerator and denominator fields.
+    (Denominators are positive; number solutions are in lowest terms.)
+    """
+    # (padding terms have 0 coefficients, so they don't affect sums)
+    a, b = exercise_batches._solve(array['coefficients'].astype(numpy.int64), array['has_x'],
+                                   array['left_terms_n'].astype(numpy.int64))
+    kind = numpy.where(a != 0, NUMBER_SOLUTION, numpy.where(b == 0, ANY_NUMBER_SOLUTION, NO_SOLUTION))
+    gcd = numpy.gcd(a, b)
+    gcd[gcd == 0] = 1
+    sign = numpy.where(a < 0, -1, 1)
+    numerator = numpy.where(kind == NUMBER_SOLUTION, -b * sign // gcd, 0)
+    denominator = numpy.where(kind == NUMBER_SOLUTION, a * sign // gcd, 1)
+    array['solution_kind'], array['solution_numerator'], array['solution_denominator'] = kind, numerator, denominator
+
+
+class ExerciseBank(object):
+    """
+    `SolveForXLinear` exercises (coefficients, difficulty, term layout and solution)
+    stored as a NumPy structured array.
+
+    Example:
+    >>> ExerciseBank.generate(n=10**5, difficulty=3, seed=1).save('bank.npz')
+    >>> bank = ExerciseBank.load('bank.npz')    # (memory-mapped)
+    >>> bank[42]    # SolveForXLinear
+    """
+
+    def __init__(self, array, var_name='x'):
+        self.array = array
+        self.var_name = var_name
+
+    def __len__(self):
+        return len(self.array)
+
+    def __getitem__(self, index):
+        return self.exercise(index)
+
+    @classmethod
+    def _from_terms_arrays(cls, difficulty, coefficients, has_x, left_terms_n, var_name='x'):
+        n, max_terms = coefficients.shape
+        array = numpy.zeros(n, dtype=bank_dtype(max_terms))
+        array['difficulty'] = difficulty
+        array['terms_n'] = max_terms
+        array['left_terms_n'] = left_terms_n
+        array['coefficients'] = coefficients
+        array['has_x'] = has_x
+        _fill_solutions(array)
+        return cls(array=array, var_name=var_name)
+
+    @classmethod
+    def generate(cls, n, difficulty=1, var_name='x',
+                 x_terms=SolveForXLinear.DEFAULT_TERM_N_ON_HIGH_DIFF,
+                 non_x_terms=SolveForXLinear.DEFAULT_TERM_N_ON_HIGH_DIFF,
+                 seed=None, rng=None):
+        """
+        Bank of `n` new exercises (same odds as `SolveForXLinear.generate_batch`).
+        """
+        SolveForXLinear._check_difficulty_and_terms(difficulty=difficulty, x_terms=x_terms, non_x_terms=non_x_terms)
+        rng = exercise_batches._numpy_generator(seed=seed, rng=rng)
+        coefficients, has_x, left_terms_n = exercise_batches._draw_terms(n, difficulty, x_terms, non_x_terms, rng)
+        return cls._from_terms_arrays(difficulty=difficulty, coefficients=coefficients, has_x=has_x,
+                                      left_terms_n=left_terms_n, var_name=var_name)
+
+    @classmethod
+    def from_exercises(cls, exercises):
+        """
+        Questions are stored as coefficients, so they're rebuilt formatted (eg. '3x=6' as '3*x=6').
+
+        :param exercises: `SolveForXLinear` exercises or records (of any difficulty).
+        :raises ValueError: If a question isn't made of `c*x` and integer terms (eg. replaced by '0.5*x=1').
+        """
+        # (all validated before the array is built)
+        records = []
+        for i, e in enumerate(exercises):
+            if isinstance(e, SolveForXLinearRecord):
+                records.append(e)
+                continue
+            try:
+                records.append(SolveForXLinearRecord.from_exercise(e))
+            except ValueError as err:
+                raise ValueError('Exercise {} not supported by banks: {}'.format(i, err))
+        var_names = {r.var_name for r in records} or {'x'}
+        if len(var_names) > 1:
+            raise ValueError('All exercises of a bank must have the same variable name.')
+        max_terms = max([len(r.coefficients) for r in records] or [0])
+        array = numpy.zeros(len(records), dtype=bank_dtype(max_terms))
+        for i, r in enumerate(records):
+            row = array[i]
+            terms_n = len(r.coefficients)
+            row['difficulty'] = r.difficulty
+            row['terms_n'] = terms_n
+            row['left_terms_n'] = r.left_terms_n
+            row['coefficients'][:terms_n] = r.coefficients
+            row['has_x'][:terms_n] = [bool(r.x_terms_mask & (1 << t)) for t in range(terms_n)]
+        _fill_solutions(array)
+        return cls(array=array, var_name=var_names.pop())
+
+    def save(self, path):
+        """
+        Saves the bank (array and variable name) as a `.npz` file.
+
+        :param path: '.npz' is appended if missing.
+        """
+        numpy.savez(_bank_path(path), array=self.array, var_name=numpy.array(self.var_name))
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        :param path: Path given to `save` ('.npz' is appended if missing).
+        :param mmap: Memory-map the array read-only instead of reading it into memory.
+        """
+        path = _bank_path(path)
+        with numpy.load(path) as npz_file:
+            var_name = str(npz_file['var_name'])
+            array = None if mmap else npz_file['array']
+        if mmap:
+            array = _memmap_npz_member(path, 'array.npy')
+        return cls(array=array, var_name=var_name)
+
+    def record(self, index):
+        """:return: (SolveForXLinearRecord)"""
+        row = self.array[index]
+        terms_n = int(row['terms_n'])
+        has_x = row['has_x'][:terms_n].tolist()
+        return SolveForXLinearRecord(difficulty=int(row['difficulty']),
+                                     coefficients=row['coefficients'][:terms_n].tolist(),
+                                     x_terms_mask=sum(1 << t for t, h in enumerate(has_x) if h),
+                                     left_terms_n=int(row['left_terms_n']),
+                                     var_name=self.var_name)
+
+    def exercise(self, index, display_class=None):
+        """:return: (SolveForXLinear)"""
+        return self.record(index).to_exercise(display_class=display_class)
+
+    def solution(self, index):
+        """
+        Stored solution (without rebuilding the exercise).
+
+        :return: (Fraction) or AnyNumber or NoSolution
+        """
+        row = self.array[index]
+        kind = int(row['solution_kind'])
+        if kind == ANY_NUMBER_SOLUTION:
+            return AnyNumber
+        if kind == NO_SOLUTION:
+            return NoSolution
+        return Fraction(int(row['solution_numerator']), int(row['solution_denominator']))
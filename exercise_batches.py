@@ -0,0 +1,121 @@
+"""
+Vectorized generation of many `SolveForXLinear` equations at once.
+
+Coefficients, term layouts and solutions of the whole batch are drawn/calculated
+as NumPy arrays; only the final string formatting happens per exercise.
+The odds of each coefficient are the same as those of `SolveForXLinear.random_equation`.
+"""
+
+
+import collections
+
+import numpy
+
+from linear_equation import (B_TIMES_A_DIFFICULTIES, LinearEquation, coefficient_samplers, question_string,
+                             question_in_latex, solution_of_coefficients)
+
+
+ExerciseColumns = collections.namedtuple('ExerciseColumns', ['question', 'question_in_latex', 'expected_answer'])
+ExerciseColumns.__doc__ = """Parallel lists (one element per exercise) used for bulk export."""
+
+
+def _int_choices(rng, sampler, size):
+    """
+    Vectorized `sampler.sample` (same candidates and odds).
+    """
+    weights = numpy.array(sampler.weights, dtype=float)
+    return rng.choice(numpy.array(sampler.candidates), size=size, p=weights / weights.sum())
+
+
+def _draw_terms(n, difficulty, x_terms, non_x_terms, rng):
+    """
+    :return: (tuple) `coefficients` and `has_x` arrays of shape (n, terms) in displayed order,
+        and `left_terms_n` array of shape (n,) (the rest of the terms are on the right side).
+    """
+    samplers = coefficient_samplers(difficulty)
+    if len(samplers) == 2:
+        # (`a*x+b=0`)
+        a_sampler, b_sampler = samplers
+        a = _int_choices(rng, a_sampler, n)
+        b = _int_choices(rng, b_sampler, n)
+        if difficulty in B_TIMES_A_DIFFICULTIES:
+            b = b * a
+    else:
+        terms_sampler, = samplers
+        terms_n = x_terms + non_x_terms
+        coefficients = _int_choices(rng, terms_sampler, (n, terms_n))
+        has_x = numpy.zeros((n, terms_n), dtype=bool)
+        has_x[:, :x_terms] = True
+        # Independent shuffle of each row.
+        order = numpy.argsort(rng.random((n, terms_n)), axis=1)
+        coefficients = numpy.take_along_axis(coefficients, order, axis=1)
+        has_x = numpy.take_along_axis(has_x, order, axis=1)
+        left_terms_n = rng.integers(0, terms_n, size=n, endpoint=True)
+        return coefficients, has_x, left_terms_n
+
+    coefficients = numpy.stack([a, b], axis=1)
+    has_x = numpy.tile([True, False], (n, 1))
+    left_terms_n = numpy.full(n, 2)
+    return coefficients, has_x, left_terms_n
+
+
+def _solve(coefficients, has_x, left_terms_n):
+    """
+    Coefficients `(a, b)` of the equivalent `a*x + b = 0` of each equation.
+
+    :return: (tuple) of arrays of shape (n,)
+    """
+    positions = numpy.arange(coefficients.shape[1])
+    sides_signs = numpy.where(positions < left_terms_n[:, None], 1, -1)
+    signed = coefficients * sides_signs
+    a = numpy.where(has_x, signed, 0).sum(axis=1)
+    b = numpy.where(has_x, 0, signed).sum(axis=1)
+    return a, b
+
+
+def _rows_terms(coefficients, has_x, left_terms_n):
+    """Yields the left and right side terms of each equation."""
+    for coefs_row, has_x_row, left_n in zip(coefficients.tolist(), has_x.tolist(), left_terms_n.tolist()):
+        terms = list(zip(coefs_row, has_x_row))
+        yield terms[:left_n], terms[left_n:]
+
+
+def _numpy_generator(seed=None, rng=None):
+    """
+    :param rng: NumPy `Generator` (used as is) or `random.Random` (seeds a new `Generator`).
+    """
+    if rng is None:
+        return numpy.random.default_rng(seed)
+    if isinstance(rng, numpy.random.Generator):
+        return rng
+    return numpy.random.default_rng(rng.getrandbits(64))
+
+
+def random_linear_equations(n, difficulty, var_name='x', x_terms=3, non_x_terms=3, seed=None, rng=None):
+    """
+    :param seed: Seed of the NumPy generator (same seed, same equations).
+    :param rng: NumPy `Generator` or `random.Random` used instead of `seed`.
+    :return: (list) of `LinearEquation`
+    """
+    rng = _numpy_generator(seed=seed, rng=rng)
+    coefficients, has_x, left_terms_n = _draw_terms(n, difficulty, x_terms, non_x_terms, rng)
+    return [LinearEquation(left_terms=left, right_terms=right, var_name=var_name)
+            for left, right in _rows_terms(coefficients, has_x, left_terms_n)]
+
+
+def random_linear_exercises_columns(n, difficulty, var_name='x', x_terms=3, non_x_terms=3, seed=None, rng=None):
+    """
+    Same equations as `random_linear_equations` (for the same args),
+    but without creating any per-exercise objects.
+
+    :return: (ExerciseColumns)
+    """
+    rng = _numpy_generator(seed=seed, rng=rng)
+    coefficients, has_x, left_terms_n = _draw_terms(n, difficulty, x_terms, non_x_terms, rng)
+    a, b = _solve(coefficients, has_x, left_terms_n)
+    questions = [question_string(left, right, var_name=var_name)
+                 for left, right in _rows_terms(coefficients, has_x, left_terms_n)]
+    return ExerciseColumns(
+        question=questions,
+        question_in_latex=[question_in_latex(q) for q in questions],
+        expected_answer=[solution_of_coefficients(a_i, b_i) for a_i, b_i in zip(a.tolist(), b.tolist())])
@@ -0,0 +1,87 @@
+"""
+Keeps the next few exercises ready, built on a background thread.
+
+Example (Kivy):
+>>> prefetcher = ExercisePrefetcher(factory=lambda: SolveForXLinear(difficulty=2), depth=3)
+>>> Clock.schedule_once(prefetcher.refill)
+>>> ..
+>>> exercise, prepared = prefetcher.pop()      # no waiting
+>>> Clock.schedule_once(prefetcher.refill)
+"""
+
+
+import collections
+import concurrent.futures
+import threading
+
+
+DEFAULT_DEPTH = 3
+
+
+class ExercisePrefetcher(object):
+    def __init__(self, factory, depth=DEFAULT_DEPTH, prepare=None):
+        """
+        :param factory: Called (without args) on the worker thread to create an exercise.
+        :param depth: Number of exercises kept ready.
+        :param prepare: Called as `prepare(exercise)` on the worker thread (eg. renders its latex);
+            its result is returned along with the exercise.
+        """
+        if depth < 1:
+            raise ValueError('Depth must be positive.')
+        self.factory = factory
+        self.depth = depth
+        self.prepare = prepare
+        self._ready = collections.deque()
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='prefetch')
+
+    def __len__(self):
+        """Number of exercises ready (including failed creations, re-raised by `pop`)."""
+        return len(self._ready)
+
+    def _create(self, prepare=True):
+        exercise = self.factory()
+        prepared = None if (self.prepare is None) or (not prepare) else self.prepare(exercise)
+        return exercise, prepared
+
+    def _create_and_store(self):
+        try:
+            self._ready.append(self._create())
+        except Exception as e:
+            # (re-raised by `pop`, on the thread using the exercises)
+            self._ready.append(e)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def refill(self, *args):
+        """
+        Queues creation of as many exercises as needed to reach `depth` (returns immediately).
+        (contains *args since it's used as `Clock` callback)
+        """
+        with self._lock:
+            missing = self.depth - len(self._ready) - self._pending
+            self._pending += max(missing, 0)
+        for _ in range(missing):
+            self._executor.submit(self._create_and_store)
+
+    def pop(self, prepare=True):
+        """
+        Next ready exercise; created on the calling thread only if none is ready yet.
+        An exception raised while creating or preparing it on the worker thread is raised here.
+
+        :param prepare: Whether an exercise created on the calling thread is prepared too
+            (eg. False if it's cheaper to prepare only what's needed later).
+        :return: (tuple) The exercise and the result of `prepare` (None without `prepare`).
+        """
+        try:
+            item = self._ready.popleft()
+        except IndexError:
+            return self._create(prepare=prepare)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
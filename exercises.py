@@ -1,22 +1,98 @@
 import abc
+import functools
 import random
-import re
-
-import mpmath
-import sympy
-from IPython.display import display
-from sympy import sympify
+import time
+from fractions import Fraction
 
 import answer_patterns
 import arbitrary_pieces
+import check_tracing
+import equation_table
+import ipython_ui
 import languages
-from arbitrary_pieces import r_int, solve_1rst_degree_poly
-from ipython_ui.qa_display_widgets import QADisplayBox, FillGapsBox
+from arbitrary_pieces import random_source
+from lazy_modules import LazyModule
+from linear_equation import LinearEquation, coefficient_samplers
+
+
+# (loaded on first use)
+mpmath = LazyModule('mpmath')
+sympy = LazyModule('sympy')
+ipython_display = LazyModule('IPython.display')
+
+
+# Relative (and absolute) tolerance of numeric answers.
+ANSWER_REL_TOLERANCE = Fraction(1, 1000)
+
+
+def sympify(*args, **kwargs):
+    return sympy.sympify(*args, **kwargs)
+
+
+# ------------------------------------------------------------------------------------------
+# Latex of answers
+
+ANSWERS_LATEX_CACHE_SIZE = 1024
+
+
+def rational_latex(numerator, denominator=1):
+    """
+    Same as `sympy.latex(sympy.Rational(numerator, denominator))`, eg. '- \\frac{1}{2}', '3'.
+
+    :param numerator: (int) In lowest terms with `denominator`.
+    :param denominator: (int) Positive.
+    """
+    if denominator == 1:
+        return str(numerator)
+    if numerator < 0:
+        return '- \\frac{{{}}}{{{}}}'.format(-numerator, denominator)
+    return '\\frac{{{}}}{{{}}}'.format(numerator, denominator)
+
+
+@functools.lru_cache(maxsize=ANSWERS_LATEX_CACHE_SIZE)
+def _cached_answer_latex(key):
+    """
+    :param key: `(numerator, denominator)` of rationals, otherwise the answer itself.
+    """
+    if type(key) is tuple:
+        return rational_latex(*key)
+    return sympy.latex(sympify(key))
+
+
+def answer_latex(ans_val):
+    """
+    Latex of a (non special) answer; same as `sympy.latex(sympify(ans_val))`.
+    Ints, `Fraction`s and sympy `Rational`s are formatted without sympy.
+    """
+    if isinstance(ans_val, (int, Fraction)):
+        key = (int(ans_val.numerator), ans_val.denominator)
+    elif getattr(ans_val, 'is_Rational', False):
+        # (sympy `Rational`s and `Integer`s; checked without importing sympy)
+        key = (int(ans_val.p), int(ans_val.q))
+    else:
+        key = ans_val
+    try:
+        return _cached_answer_latex(key)
+    except TypeError:
+        # (unhashable)
+        return sympy.latex(sympify(ans_val))
+
+
+def answer_latex_cache_info():
+    """:return: (functools._CacheInfo) Hits, misses, max size and current size of the answers' latex cache."""
+    return _cached_answer_latex.cache_info()
 
 
 class Exercise(metaclass=abc.ABCMeta):
+    # Callables receiving a `check_tracing.CheckEvent` after every check (see `add_check_observer`).
+    _CHECK_OBSERVERS = ()
+
     def __init__(self, display_class):
-        if not issubclass(self.DEFAULT_DISPLAY_CLASS, QADisplayBox):
+        """
+        :param display_class: Key of a class registered in `ipython_ui`
+            (or the class itself) used instead of `DEFAULT_DISPLAY_CLASS`.
+        """
+        if self.DEFAULT_DISPLAY_CLASS not in ipython_ui.DISPLAY_CLASSES_PATHS:
             raise TypeError('{}'.format(self.DEFAULT_DISPLAY_CLASS))
         self.display_class = display_class
         self.question_title = self._question_title()
@@ -58,7 +134,6 @@ class Exercise(metaclass=abc.ABCMeta):
         """
         pass
 
-    # TODO test
     @staticmethod
     def _default_simpify_and_convert_to_latex(expected_answers_dct):
         d = {}
@@ -66,8 +141,7 @@ class Exercise(metaclass=abc.ABCMeta):
             if ans_val in arbitrary_pieces.SPECIAL_ANSWERS_TYPES:
                 d.update({ans_name: ans_val})
             else:
-                v = sympy.latex(sympify(ans_val))
-                d.update({ans_name: v})
+                d.update({ans_name: answer_latex(ans_val)})
         return d
 
     @abc.abstractmethod
@@ -98,11 +172,14 @@ class Exercise(metaclass=abc.ABCMeta):
 
     @abc.abstractproperty
     def DEFAULT_DISPLAY_CLASS(self):
+        """Key of the display class in `ipython_ui` registry (eg. 'fill_gaps')."""
         pass
 
     def display_in_jupyter(self):
         displ_class = self.display_class or self.DEFAULT_DISPLAY_CLASS
-        display(displ_class(self).box())
+        if isinstance(displ_class, str):
+            displ_class = ipython_ui.display_class(displ_class)
+        ipython_display.display(displ_class(self).box())
 
     @staticmethod
     def _is_allowed_special_or_sympifiable_answer(answer_val, allowed_answer_types):
@@ -110,6 +187,9 @@ class Exercise(metaclass=abc.ABCMeta):
         # Covers special answer types like "AnyNumber"
         if answer_val in arbitrary_pieces.SPECIAL_ANSWERS_TYPES:
             return answer_val in allowed_answer_types
+        # Plain numbers are sympifiable (no need to call sympify)
+        elif isinstance(answer_val, str) and (answer_patterns.numeric_literal_value(answer_val) is not None):
+            return True
         # Consecutive ops are not allowed
         # (sympify doesn't mind them, so much check here)
         elif arbitrary_pieces.consecutive_operators_search(expr=str(answer_val)):
@@ -124,6 +204,21 @@ class Exercise(metaclass=abc.ABCMeta):
             except IndexError:
                 return False
 
+    # Answer-patterns (eg. `answer_patterns.INTEGER.with_sign`) used by `_is_valid_answer`.
+    ALLOWED_ANSWER_PATTERNS = ()
+
+    @classmethod
+    def _answer_validator(cls):
+        """
+        Single compiled regex that fullmatches answers matching any of `ALLOWED_ANSWER_PATTERNS`.
+        Created once per class.
+        """
+        validator = cls.__dict__.get('_ANSWER_VALIDATOR')
+        if validator is None:
+            validator = answer_patterns.any_fullmatch_validator(cls.ALLOWED_ANSWER_PATTERNS)
+            cls._ANSWER_VALIDATOR = validator
+        return validator
+
     @abc.abstractmethod
     def _is_valid_answer(self, answer):
         """
@@ -139,36 +234,91 @@ class Exercise(metaclass=abc.ABCMeta):
         pass
 
     @staticmethod
-    def _is_correct_answer(answer, expected_answer):
+    def _comparable_value(val):
+        """
+        Converts an answer to a value that can be compared with other answers.
+
+        Ints, `Fraction`s and plain numbers (eg. '-1/2', '0.5') are converted to exact `Fraction`s
+        without involving sympy; everything else is sympified.
+
+        :raises sympy.SympifyError:
+        """
+        if isinstance(val, Fraction):
+            return val
+        if isinstance(val, int) and not isinstance(val, bool):
+            return Fraction(val)
+        if isinstance(val, str):
+            literal_val = answer_patterns.numeric_literal_value(val)
+            if literal_val is not None:
+                return literal_val
+        return sympify(val)
+
+    @staticmethod
+    def _almost_equal(val1, val2):
+        """
+        Same as `mpmath.almosteq(val1, val2, rel_eps=0.001)`,
+        but calculated exactly when both are `Fraction`s.
+        """
+        fraction_types = isinstance(val1, Fraction), isinstance(val2, Fraction)
+        if all(fraction_types):
+            diff = abs(val1 - val2)
+            return (diff <= ANSWER_REL_TOLERANCE) or (diff <= ANSWER_REL_TOLERANCE * max(abs(val1), abs(val2)))
+        # (mixed with sympy objects)
+        if fraction_types[0]:
+            val1 = sympy.Rational(val1.numerator, val1.denominator)
+        if fraction_types[1]:
+            val2 = sympy.Rational(val2.numerator, val2.denominator)
+        try:
+            if mpmath.almosteq(val1, val2, rel_eps=float(ANSWER_REL_TOLERANCE)):
+                return True
+        except TypeError:
+            return val1 == val2
+        return False
+
+    @staticmethod
+    def _is_correct_answer(answer, expected_answer, timings=None):
+        """
+        :param timings: (check_tracing.StageTimings) Adds the time of each stage to it (if provided).
+        """
         if answer in arbitrary_pieces.SPECIAL_ANSWERS_TYPES:
             return answer == expected_answer
 
         else:
+            if timings is not None:
+                start = time.perf_counter()
             try:
-                sympified_given_a = sympify(answer)
-                sympified_expected_a = sympify(expected_answer)
+                given_a = Exercise._comparable_value(answer)
+                expected_a = Exercise._comparable_value(expected_answer)
                 # (special expected answers can't be sympified, but if given_answer is '4'
                 # and expecting a special answer, it should return False anyway.)
             except sympy.SympifyError:
                 return False
-
-            try:
-                if mpmath.almosteq(sympified_given_a, sympified_expected_a, rel_eps=0.001):
-                    return True
-            except TypeError:
-                return sympified_given_a == sympified_expected_a
-
-        return False
-
-    def _is_valid_and_correct_answer(self, answer_val, expected_answer):
-        if self._is_allowed_special_or_sympifiable_answer(answer_val=answer_val,
-                                                          allowed_answer_types=self.special_answers_allowed):
-            if self._is_valid_answer(answer=answer_val):
-                if self._is_correct_answer(answer=answer_val, expected_answer=expected_answer):
-                    return True
+            finally:
+                if timings is not None:
+                    timings.add(check_tracing.SYMPIFY, start)
+
+            if timings is None:
+                return Exercise._almost_equal(given_a, expected_a)
+            start = time.perf_counter()
+            is_equal = Exercise._almost_equal(given_a, expected_a)
+            timings.add(check_tracing.COMPARISON, start)
+            return is_equal
+
+    def _is_valid_and_correct_answer(self, answer_val, expected_answer, timings=None):
+        if timings is not None:
+            start = time.perf_counter()
+        is_valid = (self._is_allowed_special_or_sympifiable_answer(answer_val=answer_val,
+                                                                   allowed_answer_types=self.special_answers_allowed)
+                    and self._is_valid_answer(answer=answer_val))
+        if timings is not None:
+            timings.add(check_tracing.VALIDATION, start)
+        if is_valid:
+            if self._is_correct_answer(answer=answer_val, expected_answer=expected_answer, timings=timings):
+                return True
         return False
 
-    def _is_interchangeable_and_correct_answer(self, answer_val, expected_answers, used_interchangeable_a_names):
+    def _is_interchangeable_and_correct_answer(self, answer_val, expected_answers, used_interchangeable_a_names,
+                                               timings=None):
         for group in self.interchangeable_answers:
             if answer_val not in group:
                 continue
@@ -177,32 +327,104 @@ class Exercise(metaclass=abc.ABCMeta):
                     continue
                 else:
                     if self._is_valid_and_correct_answer(answer_val=answer_val,
-                                                         expected_answer=expected_answers[interch_a_name]):
+                                                         expected_answer=expected_answers[interch_a_name],
+                                                         timings=timings):
                         used_interchangeable_a_names.append(interch_a_name)
                         return True
 
     # TODO test individually for each Exercise
-    def _check_all_answers(self, answers, expected_answers):
+    def _check_all_answers(self, answers, expected_answers, timings=None):
         used_interchangeable_a_names = []
         for given_answer_name, answer_val in answers.items():
             if self._is_valid_and_correct_answer(answer_val=answer_val,
-                                                 expected_answer=expected_answers[given_answer_name]):
+                                                 expected_answer=expected_answers[given_answer_name],
+                                                 timings=timings):
                 continue
             # If answer name didn't match the expected val, then it might be interchangeable.
             if self._is_interchangeable_and_correct_answer(answer_val=answer_val,
                                                            expected_answers=expected_answers,
-                                                           used_interchangeable_a_names=used_interchangeable_a_names):
+                                                           used_interchangeable_a_names=used_interchangeable_a_names,
+                                                           timings=timings):
                 continue
             return False
         # If loop wasn't prematurely interrupted then all answers were correct.
         else:
             return True
 
+    def _expected_answers_for_grading(self):
+        """
+        `expected_answers` converted by `_comparable_value`.
+        Conversion happens once (unless `expected_answers` is replaced).
+        """
+        cached = getattr(self, '_grading_cache', None)
+        if (cached is None) or (cached[0] is not self.expected_answers):
+            converted = {}
+            for ans_name, ans_val in self.expected_answers.items():
+                if ans_val not in arbitrary_pieces.SPECIAL_ANSWERS_TYPES:
+                    try:
+                        ans_val = self._comparable_value(ans_val)
+                    except sympy.SympifyError:
+                        pass
+                converted[ans_name] = ans_val
+            cached = self._grading_cache = (self.expected_answers, converted)
+        return cached[1]
+
+    def grade_many(self, submissions):
+        """
+        Checks many submissions (eg. the whole classroom's) of this exercise.
+
+        :param submissions: Iterable of answers-dicts, as given to `check_all_answers`.
+        :return: (list) of bools, one per submission.
+        """
+        expected_answers = self._expected_answers_for_grading()
+        if Exercise._CHECK_OBSERVERS:
+            return [self._traced_check_all_answers(answers=answers, expected_answers=expected_answers)
+                    for answers in submissions]
+        return [self._check_all_answers(answers=answers, expected_answers=expected_answers)
+                for answers in submissions]
+
     # (contains *args since it's used as callback)
     def check_all_answers(self, answers_given, *args):
-        print(answers_given)
+        if Exercise._CHECK_OBSERVERS:
+            return self._traced_check_all_answers(answers=answers_given, expected_answers=self.expected_answers)
         return self._check_all_answers(answers=answers_given, expected_answers=self.expected_answers)
 
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def add_check_observer(observer):
+        """
+        Registers a callable that receives a `check_tracing.CheckEvent` after every check (of all exercises).
+        (Checks aren't timed at all while no observer is registered.)
+        """
+        Exercise._CHECK_OBSERVERS += (observer,)
+
+    @staticmethod
+    def remove_check_observer(observer):
+        observers = list(Exercise._CHECK_OBSERVERS)
+        observers.remove(observer)
+        Exercise._CHECK_OBSERVERS = tuple(observers)
+
+    def _traced_check_all_answers(self, answers, expected_answers):
+        timings = check_tracing.StageTimings()
+        start = time.perf_counter()
+        verdict = self._check_all_answers(answers=answers, expected_answers=expected_answers, timings=timings)
+        # (answers copied, since the caller's dict may keep changing, eg. while the user types)
+        event = check_tracing.CheckEvent(exercise_id=id(self), exercise_class=type(self).__name__,
+                                         question=self.question, answers=dict(answers), timings=timings,
+                                         total=time.perf_counter() - start, verdict=verdict)
+        for observer in Exercise._CHECK_OBSERVERS:
+            observer(event)
+        return verdict
+
+
+@functools.lru_cache(maxsize=32)
+def _solve_for_x_title(var_name):
+    return languages.Message(
+        texts_dct={
+            languages.english: 'Find the value of {}.'.format(var_name),
+            languages.greek: 'Βρες την τιμή του {}.'.format(var_name),
+        })
+
 
 class SolveForXLinear(Exercise):
     """
@@ -214,92 +436,154 @@ class SolveForXLinear(Exercise):
     ALLOWED_DIFFICULTIES = {1, 2, 3}
     DEFAULT_TERM_N_ON_HIGH_DIFF = 3
     VARIABLE_NAME = 'x'
-    DEFAULT_DISPLAY_CLASS = FillGapsBox
+    DEFAULT_DISPLAY_CLASS = 'fill_gaps'
+    ALLOWED_ANSWER_PATTERNS = (answer_patterns.DECIMAL.with_sign,
+                               answer_patterns.INTEGER.with_sign,
+                               answer_patterns.FRACTION_OF_INTS.with_sign)
 
     def __init__(self, difficulty=1, var_name='x', display_class=None,
-                 x_terms=DEFAULT_TERM_N_ON_HIGH_DIFF, non_x_terms=DEFAULT_TERM_N_ON_HIGH_DIFF):
+                 x_terms=DEFAULT_TERM_N_ON_HIGH_DIFF, non_x_terms=DEFAULT_TERM_N_ON_HIGH_DIFF,
+                 equation=None, rng=None):
         """
         :param difficulty: Defines number of terms (if not provided)
             and type of solution (int, fraction etc)
         :param var_name: Name of variable.
         :param x_terms: number of terms containing x
         :param non_x_terms: number of terms not containing x
+        :param equation: (LinearEquation) Used instead of a randomly generated one.
+        :param rng: `random.Random` or NumPy `Generator` used for generating the equation
+            (defaults to module-level `random`).
         """
-        if difficulty not in self.ALLOWED_DIFFICULTIES:
-            raise ValueError('Difficulty {}, not allowed'.format(difficulty))
-        if difficulty != max(self.ALLOWED_DIFFICULTIES):
-            if (x_terms != self.DEFAULT_TERM_N_ON_HIGH_DIFF) or (non_x_terms != self.DEFAULT_TERM_N_ON_HIGH_DIFF):
-                raise ValueError("Number of terms can be set manually only on highest difficulty.")
+        self._check_difficulty_and_terms(difficulty=difficulty, x_terms=x_terms, non_x_terms=non_x_terms)
         self.difficulty = difficulty
         self.var_name = var_name
         self.x_terms = x_terms
         self.non_x_terms = non_x_terms
+        # (generated here, so that `rng` isn't kept by the instance)
+        if equation is None:
+            equation = self.random_equation(difficulty=difficulty, var_name=var_name,
+                                            x_terms=x_terms, non_x_terms=non_x_terms, rng=rng)
+        self.equation = equation
+        # (question that `self.equation` belongs to)
+        self._equation_question = equation.question
         super().__init__(display_class=display_class)
 
+    @classmethod
+    def _check_difficulty_and_terms(cls, difficulty, x_terms, non_x_terms):
+        if difficulty not in cls.ALLOWED_DIFFICULTIES:
+            raise ValueError('Difficulty {}, not allowed'.format(difficulty))
+        if difficulty != max(cls.ALLOWED_DIFFICULTIES):
+            if (x_terms != cls.DEFAULT_TERM_N_ON_HIGH_DIFF) or (non_x_terms != cls.DEFAULT_TERM_N_ON_HIGH_DIFF):
+                raise ValueError("Number of terms can be set manually only on highest difficulty.")
+
     def _question_title(self):
-        return languages.Message(
-            texts_dct={
-                languages.english: 'Find the value of {}.'.format(self.var_name),
-                languages.greek: 'Βρες την τιμή του {}.'.format(self.var_name),
-            })
+        return _solve_for_x_title(self.var_name)
 
     @staticmethod
-    def _x_terms_strings(x_terms):
-        return ['{}*x'.format(r_int(10, '-+')) for _ in range(x_terms)]
+    def _x_terms_coefficients(x_terms, rng=None):
+        terms_sampler, = coefficient_samplers(3)
+        return terms_sampler.sample(x_terms, rng=rng)
 
     @staticmethod
-    def _non_x_terms_strings(non_x_terms):
-        return [str(r_int(10, '-+')) for _ in range(non_x_terms)]
+    def _non_x_terms_coefficients(non_x_terms, rng=None):
+        terms_sampler, = coefficient_samplers(3)
+        return terms_sampler.sample(non_x_terms, rng=rng)
 
     @staticmethod
-    def _hard_diff_left_and_right(x_terms, non_x_terms):
-        x_terms_strings = SolveForXLinear._x_terms_strings(x_terms)
-        non_x_terms_strings = SolveForXLinear._non_x_terms_strings(non_x_terms)
-        mixed = x_terms_strings + non_x_terms_strings
-        random.shuffle(mixed)
+    def _hard_diff_left_and_right_terms(x_terms, non_x_terms, rng=None):
+        """
+        :return: (tuple) Left and right side terms as `(coefficient, has_x)` pairs.
+        """
+        x_terms_lst = [(c, True) for c in SolveForXLinear._x_terms_coefficients(x_terms, rng=rng)]
+        non_x_terms_lst = [(c, False) for c in SolveForXLinear._non_x_terms_coefficients(non_x_terms, rng=rng)]
+        mixed = x_terms_lst + non_x_terms_lst
+        random_src = random_source(rng)
+        random_src.shuffle(mixed)
 
-        left_side_terms_num = random.randint(0, len(mixed))
+        left_side_terms_num = random_src.randint(0, len(mixed))
 
         left_side_terms = mixed[:left_side_terms_num]
         right_side_terms = mixed[left_side_terms_num:]
+        return left_side_terms, right_side_terms
 
-        left_side = '+'.join(left_side_terms)
-        right_side = '+'.join(right_side_terms)
-        return left_side, right_side
+    @classmethod
+    def random_equation(cls, difficulty=1, var_name='x',
+                        x_terms=DEFAULT_TERM_N_ON_HIGH_DIFF, non_x_terms=DEFAULT_TERM_N_ON_HIGH_DIFF, rng=None):
+        """
+        Generates the equation of an exercise, keeping the coefficients of all terms.
+
+        The same equation can be regenerated from a `random.Random(seed)` (or NumPy `Generator`)
+        created with the same seed.
+        Equations of difficulties 1 and 2 are picked from their precomputed `equation_table`.
+
+        :return: (LinearEquation)
+        """
+        if difficulty in equation_table.TABLE_DIFFICULTIES:
+            # (same odds as drawing `a` and `b` with `r_int`)
+            return equation_table.table(difficulty=difficulty, var_name=var_name).random_equation(rng=rng)
+        # Real solution/no solution/infinite solutions, any number of terms.
+        left_side_terms, right_side_terms = cls._hard_diff_left_and_right_terms(x_terms=x_terms,
+                                                                                non_x_terms=non_x_terms,
+                                                                                rng=rng)
+        return LinearEquation(left_terms=left_side_terms, right_terms=right_side_terms, var_name=var_name)
+
+    @classmethod
+    def generate_batch(cls, n, difficulty=1, var_name='x',
+                       x_terms=DEFAULT_TERM_N_ON_HIGH_DIFF, non_x_terms=DEFAULT_TERM_N_ON_HIGH_DIFF,
+                       seed=None, columnar=False, rng=None):
+        """
+        Generates `n` exercises from vectorized (NumPy) coefficient draws.
+
+        :param seed: Same seed produces the same exercises.
+        :param rng: NumPy `Generator` or `random.Random` used instead of `seed`.
+        :param columnar: Return `ExerciseColumns` (parallel lists of questions,
+            questions in latex and expected answers) instead of exercise objects.
+        :return: (list) or (ExerciseColumns)
+        """
+        # (NumPy is only needed for batches.)
+        import exercise_batches
+
+        cls._check_difficulty_and_terms(difficulty=difficulty, x_terms=x_terms, non_x_terms=non_x_terms)
+        if columnar:
+            return exercise_batches.random_linear_exercises_columns(n=n, difficulty=difficulty, var_name=var_name,
+                                                                    x_terms=x_terms, non_x_terms=non_x_terms,
+                                                                    seed=seed, rng=rng)
+        equations = exercise_batches.random_linear_equations(n=n, difficulty=difficulty, var_name=var_name,
+                                                             x_terms=x_terms, non_x_terms=non_x_terms, seed=seed,
+                                                             rng=rng)
+        return [cls(difficulty=difficulty, var_name=var_name, x_terms=x_terms, non_x_terms=non_x_terms, equation=eq)
+                for eq in equations]
 
     def _question(self):
-        d = self.difficulty
-        if d == 1:
-            # Positive integer solution
-            a = r_int(5, '+')
-            b = r_int(10, '-') * a
-            left_side = '{a}*x+{b}'.format(a=a, b=b)
-            right_side = '0'
-        elif d == 2:
-            # Real solution/no solution/infinite solutions
-            a = r_int(10, '-+0', weights={0: 2})
-            b = r_int(10, '-+0', weights={0: 4})
-            left_side = '{a}*x+{b}'.format(a=a, b=b)
-            right_side = '0'
-        else:
-            # Real solution/no solution/infinite solutions, any number of terms.
-            left_side, right_side = self._hard_diff_left_and_right(x_terms=self.x_terms,
-                                                                   non_x_terms=self.non_x_terms)
+        return self.equation.question
 
-            # Add '0' if the side is empty.
-            left_side = left_side or '0'
-            right_side = right_side or '0'
-        final_string = '='.join([left_side, right_side])
-        final_string = final_string.replace('+-', '-')
-        return final_string.replace('x', self.var_name)
+    def _question_equation(self):
+        """
+        The equation of `self.question` (parsed once each time the question is replaced).
 
-    def _expected_answers(self):
+        :return: (LinearEquation) or None if the question isn't made of `c*x` and integer terms
+            (eg. '0.5*x=1' or '2*(x+1)=0').
+        """
+        question = self.question
+        if self._equation_question != question:
+            try:
+                self.equation = LinearEquation.from_string(question, var_name=self.var_name)
+            except ValueError:
+                self.equation = None
+            self._equation_question = question
+        return self.equation
+
+    def _sympy_solution(self):
+        """Solution of any (linear) question, through sympy."""
         left_str, right_str = self.question.replace(' ', '').split('=')
-        left_sympified = sympify(left_str)
-        right_sympified = sympify(right_str)
-        expr = left_sympified - right_sympified
-        ans = solve_1rst_degree_poly(expr)
-        return {self.VARIABLE_NAME: ans}
+        expr = sympify(left_str) - sympify(right_str)
+        return arbitrary_pieces.solve_1rst_degree_poly(expr)
+
+    def _expected_answers(self):
+        equation = self._question_equation()
+        if equation is None:
+            return {self.VARIABLE_NAME: self._sympy_solution()}
+        return {self.VARIABLE_NAME: equation.solution}
 
     def _expected_answers_in_latex(self):
         return Exercise._default_simpify_and_convert_to_latex(expected_answers_dct=self.expected_answers)
@@ -307,17 +591,13 @@ class SolveForXLinear(Exercise):
     def _is_valid_answer(self, answer):
         if answer in self.special_answers_allowed:
             return True
-
-        patterns_allowed = [answer_patterns.DECIMAL.with_sign,
-                            answer_patterns.INTEGER.with_sign,
-                            answer_patterns.FRACTION_OF_INTS.with_sign]
-        for patt in patterns_allowed:
-            if re.fullmatch(patt, answer):
-                return True
-        return False
+        return bool(self._answer_validator().fullmatch(answer))
 
     def _question_in_latex(self):
-        return '${}$'.format(self.question.replace('*', ''))
+        equation = self._question_equation()
+        if equation is None:
+            return '${}$'.format(self.question.replace('*', ''))
+        return equation.question_in_latex
 
     @property
     def special_answers_allowed(self):
@@ -329,12 +609,158 @@ class SolveForXLinear(Exercise):
         return {}
 
 
+class SolveForXLinearRecord(object):
+    """
+    Compact stand-in of a `SolveForXLinear` (eg. for holding large exercise banks in memory).
+
+    Only the difficulty, the variable name and the coefficients of the terms are stored
+    (and the question, if it isn't formatted as the coefficients would format it, eg. '3x=6').
+    Question, latex, title and expected answers are calculated on first access and then cached.
+    Use `to_exercise` to get the full exercise (eg. for displaying it).
+    """
+    __slots__ = ('difficulty', 'var_name', 'coefficients', 'x_terms_mask', 'left_terms_n',
+                 '_question', '_question_in_latex', '_expected_answers', '_expected_answers_in_latex')
+
+    def __init__(self, difficulty, coefficients, x_terms_mask, left_terms_n, var_name='x', question=None):
+        """
+        :param coefficients: (tuple) Coefficients of all terms in the order they are displayed.
+        :param x_terms_mask: (int) Bit `i` is set if term `i` contains x.
+        :param left_terms_n: (int) Number of terms on the left side.
+        :param question: Question string, if it differs from the one formatted from the coefficients.
+        """
+        self.difficulty = difficulty
+        self.var_name = var_name
+        self.coefficients = tuple(coefficients)
+        self.x_terms_mask = x_terms_mask
+        self.left_terms_n = left_terms_n
+        if question is not None:
+            self._question = question
+
+    @classmethod
+    def from_equation(cls, equation, difficulty, question=None):
+        terms = equation.left_terms + equation.right_terms
+        x_terms_mask = sum(1 << i for i, (_, has_x) in enumerate(terms) if has_x)
+        return cls(difficulty=difficulty, var_name=equation.var_name,
+                   coefficients=[c for c, _ in terms], x_terms_mask=x_terms_mask,
+                   left_terms_n=len(equation.left_terms),
+                   question=None if question == equation.question else question)
+
+    @classmethod
+    def from_seed(cls, seed, difficulty=1, var_name='x', **kwargs):
+        """Same exercise as `SolveForXLinear(difficulty, var_name, rng=random.Random(seed), **kwargs)`."""
+        equation = SolveForXLinear.random_equation(difficulty=difficulty, var_name=var_name,
+                                                   rng=random.Random(seed), **kwargs)
+        return cls.from_equation(equation=equation, difficulty=difficulty)
+
+    @classmethod
+    def from_exercise(cls, exercise):
+        """
+        :raises ValueError: If the question isn't made of `c*x` and integer terms (eg. replaced by '0.5*x=1').
+        """
+        equation = exercise._question_equation()
+        if equation is None:
+            raise ValueError("Question {} isn't an equation of plain linear terms; "
+                             "it can't be stored as a record.".format(exercise.question))
+        return cls.from_equation(equation=equation, difficulty=exercise.difficulty, question=exercise.question)
+
+    def equation(self):
+        """:return: (LinearEquation)"""
+        terms = [(c, bool(self.x_terms_mask & (1 << i))) for i, c in enumerate(self.coefficients)]
+        return LinearEquation(left_terms=terms[:self.left_terms_n], right_terms=terms[self.left_terms_n:],
+                              var_name=self.var_name)
+
+    def _cache_equation_data(self):
+        equation = self.equation()
+        if not hasattr(self, '_question'):
+            self._question = equation.question
+        self._question_in_latex = equation.question_in_latex
+        self._expected_answers = {SolveForXLinear.VARIABLE_NAME: equation.solution}
+
+    @property
+    def question(self):
+        try:
+            return self._question
+        except AttributeError:
+            self._cache_equation_data()
+            return self._question
+
+    @property
+    def question_in_latex(self):
+        try:
+            return self._question_in_latex
+        except AttributeError:
+            self._cache_equation_data()
+            return self._question_in_latex
+
+    @property
+    def expected_answers(self):
+        try:
+            return self._expected_answers
+        except AttributeError:
+            self._cache_equation_data()
+            return self._expected_answers
+
+    @property
+    def expected_answers_in_latex(self):
+        try:
+            return self._expected_answers_in_latex
+        except AttributeError:
+            self._expected_answers_in_latex = Exercise._default_simpify_and_convert_to_latex(
+                expected_answers_dct=self.expected_answers)
+            return self._expected_answers_in_latex
+
+    @property
+    def question_title(self):
+        # (shared by all records with the same variable name)
+        return _solve_for_x_title(self.var_name)
+
+    def to_exercise(self, display_class=None):
+        """:return: (SolveForXLinear)"""
+        kwargs = {}
+        if self.difficulty == max(SolveForXLinear.ALLOWED_DIFFICULTIES):
+            x_terms_n = bin(self.x_terms_mask).count('1')
+            kwargs = dict(x_terms=x_terms_n, non_x_terms=len(self.coefficients) - x_terms_n)
+        exercise = SolveForXLinear(difficulty=self.difficulty, var_name=self.var_name, display_class=display_class,
+                                   equation=self.equation(), **kwargs)
+        if exercise.question != self.question:
+            exercise.question = self.question
+            exercise._create_remaining_data_based_on_question()
+        return exercise
+
+
+def stream(cls=SolveForXLinear, seed=None, records=False, **kwargs):
+    """
+    Yields new exercises endlessly; each one is created only when requested.
+
+    Example:
+    >>> for inst in stream(difficulty=3, seed=4): ..
+
+    :param cls: Exercise class (its constructor must accept `rng`).
+    :param seed: Seed of the random stream (same seed, same exercises).
+    :param records: Yield compact `SolveForXLinearRecord`s instead of exercises.
+    :param kwargs: Rest of the exercise's kwargs (eg. `difficulty`).
+        Records only use those of the equation (`difficulty`, `var_name`, `x_terms`, `non_x_terms`).
+    """
+    rng = random.Random(seed)
+    if records:
+        equation_kwargs = {k: v for k, v in kwargs.items() if k in ('difficulty', 'var_name', 'x_terms', 'non_x_terms')}
+        difficulty = equation_kwargs.get('difficulty', 1)
+        cls._check_difficulty_and_terms(
+            difficulty=difficulty,
+            x_terms=equation_kwargs.get('x_terms', cls.DEFAULT_TERM_N_ON_HIGH_DIFF),
+            non_x_terms=equation_kwargs.get('non_x_terms', cls.DEFAULT_TERM_N_ON_HIGH_DIFF))
+        while True:
+            yield SolveForXLinearRecord.from_equation(equation=cls.random_equation(rng=rng, **equation_kwargs),
+                                                      difficulty=difficulty)
+    while True:
+        yield cls(rng=rng, **kwargs)
+
+
 if __name__ == '__main__':
     _inst = SolveForXLinear(difficulty=3)
     print(_inst.question)
     print(_inst.expected_answers)
-    while 1:
-        _inst = SolveForXLinear(difficulty=2)
+    for _inst in stream(difficulty=2):
         _ques = _inst.question
         _ans = _inst.expected_answers
         if arbitrary_pieces.AnyNumber in _ans.values():
@@ -0,0 +1,186 @@
+"""
+Asyncio front end for grading answers of many students at once.
+
+Checks run on an executor (thread pool by default) so the event loop stays responsive.
+Submissions for the same exercise arriving within `batch_window` seconds
+are graded together with a single `Exercise.grade_many` call.
+
+Submissions arrive either in-process (`GradingService.submit` or a queue served by
+`GradingService.serve_queue`) or over a local socket (`GradingService.start_server`),
+one JSON object per line:
+    request:  {"id": 7, "exercise": "eq1", "answers": {"x": "-1/2"}}
+    response: {"id": 7, "correct": true}    (or {"id": 7, "error": "..."})
+"""
+
+
+import asyncio
+import itertools
+import json
+
+
+DEFAULT_BATCH_WINDOW = 0.005
+
+
+class GradingService(object):
+    """
+    Example:
+    >>> service = GradingService()
+    >>> key = service.register(SolveForXLinear(difficulty=2))
+    >>> verdict = await service.submit(key, {'x': '-1/2'})
+    """
+
+    def __init__(self, executor=None, batch_window=DEFAULT_BATCH_WINDOW):
+        """
+        :param executor: `concurrent.futures` executor running the checks
+            (defaults to the event loop's default thread pool).
+        :param batch_window: Seconds a submission waits for others on the same exercise.
+        """
+        self.executor = executor
+        self.batch_window = batch_window
+        self.exercises = {}
+        # {exercise key: [(answers, future), ..]}
+        self._pending = {}
+        self._keys_counter = itertools.count()
+        # (references to running tasks, so they aren't garbage-collected before they finish)
+        self._tasks = set()
+
+    def _run_task(self, coro):
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def register(self, exercise, key=None):
+        """
+        :param key: Name used by submissions (defaults to a new unique one).
+        :return: (str) The key.
+        """
+        if key is None:
+            key = 'exercise-{}'.format(next(self._keys_counter))
+        self.exercises[key] = exercise
+        return key
+
+    def unregister(self, key):
+        del self.exercises[key]
+
+    def submit(self, key, answers):
+        """
+        Must be called from the event loop's thread.
+
+        :param key: Key of a registered exercise.
+        :param answers: Answers-dict, as given to `Exercise.check_all_answers`.
+        :return: (asyncio.Future) The verdict (bool).
+        """
+        if key not in self.exercises:
+            raise KeyError('Exercise {} not registered.'.format(key))
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self._pending.setdefault(key, [])
+        batch.append((answers, future))
+        # (first submission of the batch schedules its grading)
+        if len(batch) == 1:
+            loop.call_later(self.batch_window, self._grade_pending, key)
+        return future
+
+    def _grade_pending(self, key):
+        batch = self._pending.pop(key, [])
+        if batch:
+            self._run_task(self._grade_batch(self.exercises.get(key), batch))
+
+    @staticmethod
+    def _grade_each(exercise, submissions):
+        """
+        Like `grade_many`, but an invalid submission only fails itself.
+
+        :return: (list) of bools or exceptions.
+        """
+        try:
+            return exercise.grade_many(submissions)
+        except Exception:
+            pass
+        verdicts = []
+        for answers in submissions:
+            try:
+                verdicts.append(exercise.grade_many([answers])[0])
+            except Exception as e:
+                verdicts.append(e)
+        return verdicts
+
+    async def _grade_batch(self, exercise, batch):
+        futures = [future for _, future in batch]
+        try:
+            if exercise is None:
+                raise KeyError('Exercise unregistered before grading.')
+            verdicts = await asyncio.get_running_loop().run_in_executor(
+                self.executor, self._grade_each, exercise, [answers for answers, _ in batch])
+        except Exception as e:
+            verdicts = [e] * len(futures)
+        for future, verdict in zip(futures, verdicts):
+            if future.done():
+                continue
+            if isinstance(verdict, Exception):
+                future.set_exception(verdict)
+            else:
+                future.set_result(verdict)
+
+    # ------------------------------------------------------------------------------------------
+    async def serve_queue(self, queue):
+        """
+        Grades submissions put in an `asyncio.Queue` until cancelled.
+
+        :param queue: Items are `(key, answers, reply)` tuples; `reply` is an `asyncio.Future`
+            that receives the verdict.
+        """
+        while True:
+            key, answers, reply = await queue.get()
+            try:
+                self._run_task(self._reply_when_graded(key, answers, reply))
+            finally:
+                queue.task_done()
+
+    async def _reply_when_graded(self, key, answers, reply):
+        try:
+            verdict = await self.submit(key, answers)
+        except Exception as e:
+            if not reply.done():
+                reply.set_exception(e)
+        else:
+            if not reply.done():
+                reply.set_result(verdict)
+
+    # ------------------------------------------------------------------------------------------
+    async def start_server(self, host='127.0.0.1', port=0):
+        """
+        Serves JSON-lines submissions on a local TCP socket.
+
+        :param port: 0 picks a free port (see `server.sockets[0].getsockname()`).
+        :return: (asyncio.Server)
+        """
+        return await asyncio.start_server(self._handle_connection, host=host, port=port)
+
+    async def _handle_connection(self, reader, writer):
+        tasks = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                # (each line graded concurrently, so it can be batched with the others)
+                task = asyncio.ensure_future(self._handle_line(line, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            writer.close()
+
+    async def _handle_line(self, line, writer):
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get('id')
+            response = {'id': request_id, 'correct': await self.submit(request['exercise'], request['answers'])}
+        except Exception as e:
+            response = {'id': request_id, 'error': '{}: {}'.format(type(e).__name__, e)}
+        writer.write((json.dumps(response) + '\n').encode('utf-8'))
+        await writer.drain()
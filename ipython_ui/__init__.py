@@ -0,0 +1,40 @@
+"""
+Registry of the classes that display exercises in jupyter.
+
+Exercises name their display class by key, and the module of the class
+is imported only when an exercise is actually displayed
+(headless processes never import any widgets).
+"""
+
+
+import importlib
+
+
+# key: 'module_name:ClassName'
+DISPLAY_CLASSES_PATHS = {
+    'fill_gaps': 'ipython_ui.qa_display_widgets:FillGapsBox',
+}
+
+
+def register_display_class(key, class_path):
+    """
+    :param key: Name used by exercises (eg. `DEFAULT_DISPLAY_CLASS = 'fill_gaps'`).
+    :param class_path: (str) eg. 'ipython_ui.qa_display_widgets:FillGapsBox'
+    """
+    if key in DISPLAY_CLASSES_PATHS:
+        raise ValueError('Display class key {} exists already.'.format(key))
+    DISPLAY_CLASSES_PATHS[key] = class_path
+
+
+def display_class(key):
+    """
+    Imports and returns the display class registered under `key`.
+
+    :raises TypeError: If the class is not a `QADisplayBox`.
+    """
+    module_name, class_name = DISPLAY_CLASSES_PATHS[key].split(':')
+    cls = getattr(importlib.import_module(module_name), class_name)
+    from ipython_ui.qa_display_widgets import QADisplayBox
+    if not issubclass(cls, QADisplayBox):
+        raise TypeError('{}'.format(cls))
+    return cls
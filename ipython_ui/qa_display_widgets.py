@@ -1,6 +1,9 @@
-from ipywidgets import Layout, Button, HBox, VBox, Label, Text, Box
-
 from languages import CHECK_MY_ANSWER_MSG, TYPE_ANSWER_PROMPT_MSG
+from lazy_modules import LazyModule
+
+
+# (loaded when the first box is created)
+widgets = LazyModule('ipywidgets')
 
 
 class QADisplayBox(object):
@@ -18,58 +21,59 @@ class FillGapsBox(QADisplayBox):
         self.question_in_latex = self.qa_obj.question_in_latex
         self.answer_given = ''
 
-        self.check_answer_button = Button(description=CHECK_MY_ANSWER_MSG, layout=Layout(width='auto'))
+        self.check_answer_button = widgets.Button(description=CHECK_MY_ANSWER_MSG,
+                                                  layout=widgets.Layout(width='auto'))
         self.check_answer_button.style.button_color = '#5dfd57'
 
     @staticmethod
     def _special_answers_buttons_box(special_answers_allowed):
         buttons_lst = []
         for a_class in special_answers_allowed:
-            b = Button(description=a_class.button_text, )
+            b = widgets.Button(description=a_class.button_text, )
             b.style.button_color = '#d6d6d6'
             buttons_lst.append(b)
-        return VBox(buttons_lst)
+        return widgets.VBox(buttons_lst)
 
     def _answers_inputs_box(self, answers, special_answers_allowed):
         # Text-inputs
         texts_widgets_lst = []
         for a_key in answers:
             label_text = '{}= '.format(a_key)
-            single_text_box = HBox([
-                Label(label_text, layout=Layout(width='auto')),
-                Text(placeholder=TYPE_ANSWER_PROMPT_MSG, layout=Layout(width='auto'))])
+            single_text_box = widgets.HBox([
+                widgets.Label(label_text, layout=widgets.Layout(width='auto')),
+                widgets.Text(placeholder=TYPE_ANSWER_PROMPT_MSG, layout=widgets.Layout(width='auto'))])
             texts_widgets_lst.append(single_text_box)
-        texts_widgets_box = Box(texts_widgets_lst)
+        texts_widgets_box = widgets.Box(texts_widgets_lst)
 
-        return VBox(
+        return widgets.VBox(
             [
-                HBox(
+                widgets.HBox(
                     [texts_widgets_box,
                      FillGapsBox._special_answers_buttons_box(special_answers_allowed=special_answers_allowed),
-                     Button(description='?', layout=Layout(width='40px'))]
+                     widgets.Button(description='?', layout=widgets.Layout(width='40px'))]
                 ),
                 self.check_answer_button,
-            ], layout=Layout(border='thin solid grey', width=FillGapsBox.Q_AND_A_WIDTH)
+            ], layout=widgets.Layout(border='thin solid grey', width=FillGapsBox.Q_AND_A_WIDTH)
         )
 
     @staticmethod
     def q_box(q_title, q_in_latex):
-        return VBox([
-            Label(q_title, layout=Layout(width='auto')),
-            Label(q_in_latex, layout=Layout(width='auto'))],
-            layout=Layout(border='thin solid grey', width=FillGapsBox.Q_AND_A_WIDTH))
+        return widgets.VBox([
+            widgets.Label(q_title, layout=widgets.Layout(width='auto')),
+            widgets.Label(q_in_latex, layout=widgets.Layout(width='auto'))],
+            layout=widgets.Layout(border='thin solid grey', width=FillGapsBox.Q_AND_A_WIDTH))
 
     def box(self):
         textinputs_box = self._answers_inputs_box(answers=self.expected_answers,
                                                   special_answers_allowed=self.special_answers_allowed)
-        box_layout = Layout(display='flex',
-                            flex_flow='column',
-                            align_items='stretch',
-                            border='solid',
-                            width='70%')
+        box_layout = widgets.Layout(display='flex',
+                                    flex_flow='column',
+                                    align_items='stretch',
+                                    border='solid',
+                                    width='70%')
         items = [
             FillGapsBox.q_box(q_title=self.question_title, q_in_latex=self.question_in_latex),
             textinputs_box
         ]
 
-        return VBox(children=items, layout=box_layout)
+        return widgets.VBox(children=items, layout=box_layout)
@@ -0,0 +1,151 @@
+"""
+Renders latex strings (eg. '$x=-2$') to RGBA images, caching the results.
+
+Rendering uses matplotlib's object-oriented `Figure` and `FigureCanvasAgg` only
+(no pyplot global state, no GUI backend), so it can run on any thread;
+`RasterizerPool` renders on background threads.
+(Matplotlib's mathtext parser is shared and not thread-safe,
+so renders themselves run one at a time.)
+The same few answers and questions are shown again and again,
+so each distinct (latex string, font size, dpi) is rendered only once.
+
+Example:
+>>> pool = RasterizerPool()
+>>> future = pool.submit('$x=-2$')
+>>> rgba_cache = RenderCache(render_func=render_rgba, maxsize=64)
+>>> rgba_cache.get('$x=-2$')     # rendered
+>>> rgba_cache.get('$x=-2$')     # cached
+"""
+
+
+import collections
+import concurrent.futures
+import math
+import threading
+
+from lazy_modules import LazyModule
+
+
+# (loaded on first render)
+matplotlib_figure = LazyModule('matplotlib.figure')
+backend_agg = LazyModule('matplotlib.backends.backend_agg')
+
+
+DEFAULT_FONT_SIZE = 20
+DEFAULT_DPI = 100
+DEFAULT_CACHE_SIZE = 64
+# Transparent margin around the text (pixels).
+_PADDING = 2
+
+_MATHTEXT_LOCK = threading.Lock()
+
+
+RgbaImage = collections.namedtuple('RgbaImage', ['width', 'height', 'buffer'])
+RgbaImage.__doc__ = """
+`buffer` is a flat (1-D) memoryview of `width * height` RGBA pixels (unsigned bytes), top row first;
+eg. for a Kivy texture:
+    texture = Texture.create(size=(im.width, im.height), colorfmt='rgba')
+    texture.blit_buffer(im.buffer, colorfmt='rgba', bufferfmt='ubyte')
+    texture.flip_vertical()
+"""
+
+
+def render_rgba(latex_str, font_size=DEFAULT_FONT_SIZE, dpi=DEFAULT_DPI):
+    """
+    Thread-safe.
+
+    :return: (RgbaImage) `latex_str` on a transparent background, cropped around the text.
+        (`buffer` is a flat view of the renderer's own buffer; nothing is copied.)
+    """
+    fig = matplotlib_figure.Figure(dpi=dpi)
+    fig.patch.set_alpha(0)
+    canvas = backend_agg.FigureCanvasAgg(fig)
+    text = fig.text(0, 0, latex_str, size=font_size,
+                    horizontalalignment='left', verticalalignment='bottom')
+    with _MATHTEXT_LOCK:
+        # (figure is resized to fit the text)
+        extent = text.get_window_extent(renderer=canvas.get_renderer())
+        width = max(1, math.ceil(extent.width) + 2 * _PADDING)
+        height = max(1, math.ceil(extent.height) + 2 * _PADDING)
+        fig.set_size_inches(width / dpi, height / dpi)
+        text.set_position((_PADDING / width, _PADDING / height))
+        canvas.draw()
+    buffer = canvas.buffer_rgba()
+    height, width = buffer.shape[:2]
+    # (`blit_buffer` needs flat bytes; `buffer_rgba` is shaped (height, width, 4))
+    return RgbaImage(width=width, height=height, buffer=buffer.cast('B'))
+
+
+class RasterizerPool(object):
+    """
+    Renders latex strings on background threads.
+    """
+
+    def __init__(self, max_workers=1):
+        """
+        :param max_workers: Number of threads (more threads only help if other work
+            happens between renders, since renders run one at a time).
+        """
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers,
+                                                               thread_name_prefix='latex-rasterizer')
+
+    def submit(self, latex_str, font_size=DEFAULT_FONT_SIZE, dpi=DEFAULT_DPI):
+        """:return: (concurrent.futures.Future) The `RgbaImage`."""
+        return self._executor.submit(render_rgba, latex_str, font_size, dpi)
+
+    def render_many(self, latex_strings, font_size=DEFAULT_FONT_SIZE, dpi=DEFAULT_DPI):
+        """
+        Renders all strings concurrently and waits for them.
+
+        :return: (dict) {(latex str, font size, dpi): RgbaImage}
+        """
+        futures = {(s, font_size, dpi): self.submit(s, font_size=font_size, dpi=dpi) for s in latex_strings}
+        return {key: f.result() for key, f in futures.items()}
+
+    def shutdown(self, wait=False):
+        self._executor.shutdown(wait=wait)
+
+
+class RenderCache(object):
+    """
+    Least recently used renders of latex strings.
+
+    Not thread-safe; meant to be used from a single thread (eg. Kivy's, when the renders are textures).
+    """
+
+    def __init__(self, render_func, maxsize=DEFAULT_CACHE_SIZE):
+        """
+        :param render_func: Called as `render_func(latex_str, font_size, dpi)`.
+        :param maxsize: Number of renders kept (least recently used are evicted first).
+        """
+        if maxsize < 1:
+            raise ValueError('Cache size must be positive.')
+        self.render_func = render_func
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._renders = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._renders)
+
+    def __contains__(self, key):
+        """:param key: (tuple) `(latex_str, font_size, dpi)`"""
+        return key in self._renders
+
+    def get(self, latex_str, font_size=DEFAULT_FONT_SIZE, dpi=DEFAULT_DPI):
+        key = (latex_str, font_size, dpi)
+        try:
+            rendered = self._renders[key]
+        except KeyError:
+            self.misses += 1
+            rendered = self._renders[key] = self.render_func(latex_str, font_size, dpi)
+            if len(self._renders) > self.maxsize:
+                self._renders.popitem(last=False)
+        else:
+            self.hits += 1
+            self._renders.move_to_end(key)
+        return rendered
+
+    def clear(self):
+        self._renders.clear()
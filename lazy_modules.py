@@ -0,0 +1,36 @@
+"""
+Modules imported on their first real use instead of at import time.
+
+Heavy dependencies (sympy, mpmath, IPython, ipywidgets) take seconds to import,
+while most processes (eg. generation workers) never use some of them.
+
+Example:
+    sympy = LazyModule('sympy')
+    sympy.latex(..)     # sympy is imported here
+"""
+
+
+import importlib
+
+
+class LazyModule(object):
+    """
+    Stand-in for a module; the module is imported when any of its attributes is first accessed.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        # (only called for attributes not found on the object itself)
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = 'loaded' if self._module is not None else 'not loaded'
+        return '<{} {!r} ({})>'.format(type(self).__name__, self._name, state)
@@ -0,0 +1,158 @@
+"""
+Sympy-free representation of first degree equations (eg. `3*x-2=x+4`).
+
+The equation is kept as the coefficients of its terms,
+so the question string, its latex and the solution are all derived
+with plain integer/`Fraction` arithmetic.
+"""
+
+
+import functools
+import re
+from fractions import Fraction
+
+from arbitrary_pieces import AnyNumber, NoSolution, int_sampler
+
+
+# Single unsigned term of a side, eg. "3*x", "4", "x".
+_TERM_PATT = r'(?:(\d+)(\*?{var})?|({var}))'
+# Terms separated by signs, eg. "-3*x+4-x".
+_SIDE_PATT = r'[+-]?{term}(?:[+-]{term})*'
+
+# `r_int` args (bounds, pos_neg_0, weights) of the coefficients of `SolveForXLinear` equations, per difficulty.
+# Difficulties 1 and 2 (`a*x+b=0`): draws of `a` and `b`. Difficulty 3: draw of every term.
+COEFFICIENT_DRAWS = {
+    # Positive integer solution
+    1: ((5, '+', None), (10, '-', None)),
+    # Real solution/no solution/infinite solutions
+    2: ((10, '-+0', {0: 2}), (10, '-+0', {0: 4})),
+    # Real solution/no solution/infinite solutions, any number of terms.
+    3: ((10, '-+', None),),
+}
+# Difficulties where the drawn `b` is multiplied by `a` (so that the solution is an int).
+B_TIMES_A_DIFFICULTIES = frozenset({1})
+
+
+def coefficient_samplers(difficulty):
+    """
+    :return: (tuple) `IntSampler`s of `COEFFICIENT_DRAWS[difficulty]`.
+    """
+    if difficulty not in COEFFICIENT_DRAWS:
+        raise ValueError('Difficulty {}, not allowed'.format(difficulty))
+    return tuple(int_sampler(bounds, pos_neg_0, weights=weights)
+                 for bounds, pos_neg_0, weights in COEFFICIENT_DRAWS[difficulty])
+
+
+def question_string(left_terms, right_terms, var_name='x'):
+    """
+    Formats the sides' terms, eg. `((3, True), (-6, False))` and `()` to `'3*x-6=0'`.
+    """
+    sides_strings = []
+    for terms in (left_terms, right_terms):
+        strings = ['{}*x'.format(c) if has_x else str(c) for c, has_x in terms]
+        # Add '0' if the side is empty.
+        sides_strings.append('+'.join(strings) or '0')
+    final_string = '='.join(sides_strings)
+    final_string = final_string.replace('+-', '-')
+    return final_string.replace('x', var_name)
+
+
+def question_in_latex(question):
+    return '${}$'.format(question.replace('*', ''))
+
+
+@functools.lru_cache(maxsize=4096)
+def question_and_latex(left_terms, right_terms, var_name='x'):
+    """
+    Cached `question_string` and its `question_in_latex`
+    (the same equations keep coming up on low difficulties).
+
+    :param left_terms: (tuple)
+    :param right_terms: (tuple)
+    :return: (tuple)
+    """
+    question = question_string(left_terms, right_terms, var_name=var_name)
+    return question, question_in_latex(question)
+
+
+def solution_of_coefficients(a, b):
+    """
+    Solution of `a*x + b = 0`.
+
+    :return: (Fraction) or AnyNumber or NoSolution
+    """
+    if a == 0:
+        # 2x-2x=0 or 0x=0 hold for any x, while 0x=4 never does.
+        return NoSolution if b else AnyNumber
+    return Fraction(-b, a)
+
+
+class LinearEquation(object):
+    """
+    Linear equation kept as the terms of each side.
+
+    Each side is a sequence of `(coefficient, has_x)` pairs in the order they appear,
+    eg. `3*x-2=4` is `left_terms=((3, True), (-2, False))`, `right_terms=((4, False),)`.
+    An empty side is displayed as '0'.
+    """
+
+    def __init__(self, left_terms, right_terms, var_name='x'):
+        self.left_terms = tuple(left_terms)
+        self.right_terms = tuple(right_terms)
+        self.var_name = var_name
+        # Everything is derived in a single pass over the terms.
+        self.question, self.question_in_latex = question_and_latex(self.left_terms, self.right_terms,
+                                                                   var_name=var_name)
+        self.solution = solution_of_coefficients(*self.coefficients())
+
+    def __eq__(self, other):
+        if not isinstance(other, LinearEquation):
+            return NotImplemented
+        return ((self.left_terms, self.right_terms, self.var_name) ==
+                (other.left_terms, other.right_terms, other.var_name))
+
+    def __hash__(self):
+        return hash((self.left_terms, self.right_terms, self.var_name))
+
+    def __repr__(self):
+        return '{}({!r})'.format(type(self).__name__, self.question)
+
+    def coefficients(self):
+        """
+        Coefficients `(a, b)` of the equivalent `a*x + b = 0`.
+
+        :return: (tuple) of ints
+        """
+        a = b = 0
+        for sign, terms in ((1, self.left_terms), (-1, self.right_terms)):
+            for c, has_x in terms:
+                if has_x:
+                    a += sign * c
+                else:
+                    b += sign * c
+        return a, b
+
+    @staticmethod
+    def _side_terms(side_str, var_name):
+        term_patt = _TERM_PATT.format(var=re.escape(var_name))
+        if not re.fullmatch(_SIDE_PATT.format(term=term_patt), side_str):
+            raise ValueError('Unexpected terms in: {}'.format(side_str))
+        terms = []
+        for sign, num, x_part, lone_x in re.findall('([+-]?)' + term_patt, side_str):
+            c = int(num) if num else 1
+            terms.append((-c if sign == '-' else c, bool(x_part or lone_x)))
+        return terms
+
+    @classmethod
+    def from_string(cls, question, var_name='x'):
+        """
+        Parses equations such as `'3*x-2=x+4'` (only int coefficients are supported).
+
+        NOTE: A side that is exactly '0' is treated as empty,
+            so that generated questions are reproduced exactly.
+        """
+        sides = question.replace(' ', '').split('=')
+        if len(sides) != 2 or not all(sides):
+            raise ValueError('Expected a single "=" between two non-empty sides: {}'.format(question))
+        left_terms, right_terms = [() if s == '0' else cls._side_terms(s, var_name) for s in sides]
+        return cls(left_terms=left_terms, right_terms=right_terms, var_name=var_name)
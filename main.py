@@ -1,3 +1,6 @@
+# (first, so that startup times include every import)
+import startup_trace
+
 # Used for screenshots that match size of current screenshots in GooglePlay
 if 1:
     from kivy.config import Config
@@ -5,42 +8,40 @@ if 1:
     Config.set('graphics', 'height', '700')
 
 
-import matplotlib
-matplotlib.use("module://kivy.garden.matplotlib.backend_kivy")
-from matplotlib import pyplot
-from kivy.garden.matplotlib import FigureCanvasKivyAgg
+# (widgets needed only by slides that aren't shown at startup are imported where they're used;
+# those only used in the .kv file are imported by Kivy's `Factory` when first needed)
 from kivy.app import App
 from kivy.uix.button import Button
-from kivy.animation import Animation
 from kivy.uix.textinput import TextInput
 from kivy.uix.label import Label as Label
 from kivy.properties import ObjectProperty, DictProperty, NumericProperty, BooleanProperty, ListProperty, StringProperty
-from kivy.storage.jsonstore import JsonStore
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.dropdown import DropDown
 from kivy.uix.widget import Widget
-from kivy.uix.popup import Popup
 from kivy.uix.image import Image
+from kivy.graphics.texture import Texture
 from kivy.uix.scatterlayout import ScatterLayout
-from kivy.uix.floatlayout import FloatLayout
 from kivy.uix.scrollview import ScrollView
-from kivy.uix.gridlayout import GridLayout
-from kivy.uix.stacklayout import StackLayout
 from kivy.clock import Clock
 from kivy.uix.carousel import Carousel
-from kivy import platform
+from kivy.factory import Factory
+from kivy.logger import Logger
+
+startup_trace.mark('kivy imported')
 
 
+import about_module
 import arbitrary_pieces
-import attributions
+import exercise_prefetch
 import exercises
 import languages
+import latex_rendering
+
+startup_trace.mark('app modules imported')
 
 
 __version__ = '0.0.1'
 
-# TODO find appropriate name
-APP_NAME = 'Free edu'
+APP_NAME = about_module.APP_NAME
 STANDARD_BUTTON_HEIGHT = '30sp'
 
 # -----------------------------------------------------------------------------------------------
@@ -84,6 +85,9 @@ class ScrollLabel(ScrollView):
 class AttributionsBox(BoxLayout):
     # TODO: Grid buttons need to maintain ratio, without resorting to fixed size.
     def __init__(self, **kwargs):
+        from kivy.uix.gridlayout import GridLayout
+        from kivy.uix.popup import Popup
+
         super(AttributionsBox, self).__init__(orientation='vertical', **kwargs)
         self.add_widget(Label(text='Attributions', size_hint_y=.2, bold=True))
         self.grid = GridLayout(cols=3)
@@ -102,6 +106,8 @@ class AttributionsBox(BoxLayout):
         return '/'.join([THIRD_PARTIES_IMAGES_DIR, im_name])
 
     def populate_grid(self):
+        import attributions
+
         for im_name, citation_obj in attributions.FIRST_IMAGE_TO_CITATION_MAP.items():
             im_path = self.third_parties_image_path(im_name=im_name)
             b = Button(background_normal=im_path, size_hint=(None, None), width='50sp', height='50sp')
@@ -127,64 +133,138 @@ class VBoxLayout(BoxLayout):
 
 
 # -----------------------------------------------------------------------------------------------
-_INITIAL_EXERCISE = exercises.SolveForXLinear(difficulty=2)
+LATEX_RASTERIZER_POOL = latex_rendering.RasterizerPool()
+
+# Images of the current exercise rendered in the background (see `EXERCISES_PREFETCHER`);
+# turned to textures on Kivy's thread when first shown.
+_PREFETCHED_IMAGES = {}
+
+
+def _latex_texture(latex_str, font_size, dpi):
+    im = _PREFETCHED_IMAGES.pop((latex_str, font_size, dpi), None)
+    if im is None:
+        im = latex_rendering.render_rgba(latex_str, font_size=font_size, dpi=dpi)
+    texture = Texture.create(size=(im.width, im.height), colorfmt='rgba')
+    # (the renderer's buffer is uploaded as is)
+    texture.blit_buffer(im.buffer, colorfmt='rgba', bufferfmt='ubyte')
+    # (buffer's first row is the top one)
+    texture.flip_vertical()
+    return texture
+
+
+# (textures are created and used on Kivy's thread only)
+LATEX_TEXTURES = latex_rendering.RenderCache(render_func=_latex_texture, maxsize=64)
 
 
 class LatexWidget(BoxLayout):
     text = StringProperty('')
+    font_size = NumericProperty(latex_rendering.DEFAULT_FONT_SIZE)
+    dpi = NumericProperty(latex_rendering.DEFAULT_DPI)
 
     def __init__(self, **kwargs):
         self.scatterlayout = ScatterLayout(do_rotation=False, do_translation_y=False)
+        # (same image widget reused for every text; only its texture changes)
+        self.image = Image(allow_stretch=True, keep_ratio=True)
         super(LatexWidget, self).__init__(**kwargs)
+        self.scatterlayout.add_widget(self.image)
         self.add_widget(self.scatterlayout)
 
     @staticmethod
-    def latex_image(latex_str):
-        fig, ax = pyplot.subplots()
-        ax.axis('off')
-        ax.text(.5, .5, latex_str,
-                size=20,
-                horizontalalignment='center', verticalalignment='center',
-                bbox={})
-        return FigureCanvasKivyAgg(fig)
+    def latex_texture(latex_str, font_size=latex_rendering.DEFAULT_FONT_SIZE, dpi=latex_rendering.DEFAULT_DPI):
+        """Rendered only the first time it's needed (see `LATEX_TEXTURES`)."""
+        return LATEX_TEXTURES.get(latex_str, font_size=font_size, dpi=dpi)
 
     def on_text(self, *args):
-        if self.scatterlayout.children:
-            self.remove_widget(self.scatterlayout.children[0])
-        im = LatexWidget.latex_image(self.text)
-        self.scatterlayout.add_widget(im)
+        self.image.texture = LatexWidget.latex_texture(self.text, font_size=self.font_size, dpi=self.dpi)
 
 
 class LicensesWidget(BoxLayout):
     POPUP_TITLE_SIZE = '20sp'
 
     def __init__(self, **kwargs):
+        from kivy.uix.popup import Popup
+
         super(LicensesWidget, self).__init__(orientation='vertical', **kwargs)
         self.popup = Popup(size_hint=(.9, .7), title_size=self.POPUP_TITLE_SIZE)
+        self.popup.bind(on_dismiss=self.on_popup_dismiss)
         self.popup_content = ScrollLabel()
         self.popup.add_widget(self.popup_content)
         self.populate_widg()
 
     def populate_widg(self):
         self.add_widget(Label(text=boldify('Licenses'), font_size=self.POPUP_TITLE_SIZE, size_hint_y=None, height='40sp'))
-        from about_module import LICENSES_DCT
-        for _name, licence in LICENSES_DCT.items():
-            name = _name.capitalize()
+        for license_name in about_module.license_paths():
+            name = license_name.capitalize()
             b = Button(text=name, bold=True, size_hint_y=None, height=STANDARD_BUTTON_HEIGHT)
             b.popup_title = name
-            b.license_txt = licence
+            b.license_name = license_name
             b.bind(on_release=self.on_button_release)
             self.add_widget(b)
 
     def on_button_release(self, btn):
         self.popup.title = boldify(txt_str=btn.popup_title)
-        self.popup_content.text = btn.license_txt
+        # (read only now; released along with the label's text)
+        self.popup_content.text = about_module.license_text(btn.license_name)
         self.popup.open()
 
+    def on_popup_dismiss(self, *args):
+        self.popup_content.text = ''
+
 
 ANSWER_KEY_EQUALS = '{}='
 
 
+def answers_latex_str(expected_answers_in_latex):
+    """eg. '$x=- \\frac{1}{2}$'"""
+    non_latex_s = ''
+    for a_name in sorted(expected_answers_in_latex):
+        a_val = expected_answers_in_latex[a_name]
+        # (simply places "z=" at the start;
+        # different type of answers would need different implementation elsewhere too)
+        if non_latex_s:
+            non_latex_s += ', '
+        non_latex_s += ANSWER_KEY_EQUALS.format(a_name) + r'{}'.format(a_val.strip('$'))
+    return '${}$'.format(non_latex_s)
+
+
+# -----------------------------------------------------------------------------------------------
+EXERCISES_PREFETCH_DEPTH = 3
+
+
+def _new_exercise():
+    return exercises.SolveForXLinear(difficulty=2)
+
+
+def _render_exercise_latex(exercise):
+    """
+    Runs on the prefetch thread.
+
+    :return: (dict) {(latex str, font size, dpi): RgbaImage} of the question and the answers.
+    """
+    latex_strings = [exercise.question_in_latex]
+    answers = exercise.expected_answers_in_latex
+    if not set(arbitrary_pieces.SPECIAL_ANSWERS_TYPES) & set(answers.values()):
+        latex_strings.append(answers_latex_str(answers))
+    return LATEX_RASTERIZER_POOL.render_many(latex_strings)
+
+
+EXERCISES_PREFETCHER = exercise_prefetch.ExercisePrefetcher(factory=_new_exercise, depth=EXERCISES_PREFETCH_DEPTH,
+                                                            prepare=_render_exercise_latex)
+
+
+def next_exercise():
+    """
+    Prefetched exercise (its rendered latex becomes available to `LATEX_TEXTURES`);
+    schedules the prefetch of another one.
+    """
+    # (if none is ready, eg. at startup, its latex is rendered only when shown)
+    exercise, images = EXERCISES_PREFETCHER.pop(prepare=False)
+    _PREFETCHED_IMAGES.clear()
+    _PREFETCHED_IMAGES.update(images or {})
+    Clock.schedule_once(EXERCISES_PREFETCHER.refill)
+    return exercise
+
+
 class AnswersInputBox(BoxLayout):
     exercise = ObjectProperty()
     answers_given = DictProperty()
@@ -287,15 +367,7 @@ class RevealedAnswersBox(BoxLayout):
         self.add_widget(self.main_content_box)
 
     def all_answers_as_latex_str(self):
-        non_latex_s = ''
-        for a_name in sorted(self.expected_answers_in_latex):
-            a_val = self.expected_answers_in_latex[a_name]
-            # (simply places "z=" at the start;
-            # different type of answers would need different implementation elsewhere too)
-            if non_latex_s:
-                non_latex_s += ', '
-            non_latex_s += ANSWER_KEY_EQUALS.format(a_name) + r'{}'.format(a_val.strip('$'))
-        return '${}$'.format(non_latex_s)
+        return answers_latex_str(self.expected_answers_in_latex)
 
     def on_ok_button_release(self, *args):
         self.clear_widgets()
@@ -303,7 +375,21 @@ class RevealedAnswersBox(BoxLayout):
         self.reveal_button.disabled = False
         self.check_answers_button.disabled = False
         self.answers_input_box.disabled = False
-        app.root.exercise = exercises.SolveForXLinear(difficulty=2)
+        app.root.exercise = next_exercise()
+
+
+class LazySlide(BoxLayout):
+    """
+    Carousel slide whose content (an instance of the `content_class` rule/class)
+    is created the first time the slide is shown.
+    """
+    content_class = StringProperty('')
+    content = ObjectProperty(None, allownone=True)
+
+    def build_content(self):
+        if self.content is None:
+            self.content = Factory.get(self.content_class)()
+            self.add_widget(self.content)
 
 
 class MainWidget(Carousel):
@@ -313,11 +399,34 @@ class MainWidget(Carousel):
     def __init__(self, **kwargs):
         super(MainWidget, self).__init__(**kwargs)
 
+    def on_current_slide(self, *args):
+        if isinstance(self.current_slide, LazySlide):
+            self.current_slide.build_content()
+
+
+def _log_startup_trace(*args):
+    startup_trace.mark('first frame')
+    for line in startup_trace.report().splitlines():
+        Logger.info('Startup: {}'.format(line))
+
 
 class PreciousMathApp(App):
 
     def build(self):
-        return MainWidget()
+        startup_trace.mark('build started')
+        # (before the root, whose kv rule pops the first exercise)
+        EXERCISES_PREFETCHER.refill()
+        root = MainWidget()
+        startup_trace.mark('root built')
+        return root
+
+    def on_start(self):
+        # (called right before the first frame is drawn)
+        Clock.schedule_once(_log_startup_trace)
+
+    def on_stop(self):
+        EXERCISES_PREFETCHER.shutdown()
+        LATEX_RASTERIZER_POOL.shutdown()
 
 
 if __name__ == '__main__':
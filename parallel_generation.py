@@ -0,0 +1,91 @@
+"""
+Generates `SolveForXLinear` exercises on several processes.
+
+Exercises are generated in fixed-size chunks, each chunk with its own seeded random stream.
+The chunk seeds derive only from the master seed, so the same master seed produces
+exactly the same exercises regardless of the number of workers.
+Only a few chunks per worker are submitted ahead of the consumer,
+so memory doesn't grow with `n`, and pending chunks are cancelled if the consumer stops early.
+"""
+
+
+import collections
+import concurrent.futures
+import itertools
+import os
+import random
+
+from exercises import SolveForXLinear
+
+
+DEFAULT_CHUNK_SIZE = 100
+# Chunks submitted (or being generated) at any time, per worker.
+CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
+
+def _chunks_seeds_and_sizes(n, master_seed, chunk_size):
+    """Yields `(chunk seed, chunk size)` of each chunk."""
+    master_rng = random.Random(master_seed)
+    for start in range(0, n, chunk_size):
+        yield master_rng.getrandbits(64), min(chunk_size, n - start)
+
+
+def _generate_chunk(chunk_seed, chunk_size, exercise_kwargs):
+    """
+    Runs on the worker process.
+
+    :return: (list) of `LinearEquation` (exercises themselves are recreated by the caller).
+    """
+    rng = random.Random(chunk_seed)
+    return [SolveForXLinear.random_equation(rng=rng, **exercise_kwargs) for _ in range(chunk_size)]
+
+
+def generate_exercises(n, difficulty=1, master_seed=None, max_workers=None, ordered=True,
+                       chunk_size=DEFAULT_CHUNK_SIZE, **kwargs):
+    """
+    Yields `n` `SolveForXLinear` exercises generated on a process pool.
+
+    :param master_seed: Seed from which all chunk seeds derive.
+    :param max_workers: Number of processes (defaults to the number of CPUs).
+    :param ordered: If True, exercises are yielded in the same order for the same master seed.
+        Otherwise chunks are yielded as soon as they're generated.
+    :param chunk_size: Number of exercises generated per task.
+        (Unlike `max_workers` it affects which exercises are generated.)
+    :param kwargs: Rest of `SolveForXLinear` kwargs (`var_name`, `x_terms`, `non_x_terms`).
+    """
+    SolveForXLinear._check_difficulty_and_terms(
+        difficulty=difficulty,
+        x_terms=kwargs.get('x_terms', SolveForXLinear.DEFAULT_TERM_N_ON_HIGH_DIFF),
+        non_x_terms=kwargs.get('non_x_terms', SolveForXLinear.DEFAULT_TERM_N_ON_HIGH_DIFF))
+    exercise_kwargs = dict(kwargs, difficulty=difficulty)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    chunks = _chunks_seeds_and_sizes(n, master_seed, chunk_size)
+
+    executor = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+
+    def submit_chunks(k):
+        return [executor.submit(_generate_chunk, chunk_seed, size, exercise_kwargs)
+                for chunk_seed, size in itertools.islice(chunks, k)]
+
+    try:
+        if ordered:
+            in_flight = collections.deque(submit_chunks(CHUNKS_IN_FLIGHT_PER_WORKER * max_workers))
+            while in_flight:
+                equations = in_flight.popleft().result()
+                # (next chunk is generated while this one is consumed)
+                in_flight.extend(submit_chunks(1))
+                for eq in equations:
+                    yield SolveForXLinear(equation=eq, **exercise_kwargs)
+        else:
+            in_flight = set(submit_chunks(CHUNKS_IN_FLIGHT_PER_WORKER * max_workers))
+            while in_flight:
+                done, in_flight = concurrent.futures.wait(in_flight,
+                                                          return_when=concurrent.futures.FIRST_COMPLETED)
+                in_flight.update(submit_chunks(len(done)))
+                for f in done:
+                    for eq in f.result():
+                        yield SolveForXLinear(equation=eq, **exercise_kwargs)
+    finally:
+        # (chunks not yet started are dropped if the consumer stopped early)
+        executor.shutdown(wait=False, cancel_futures=True)
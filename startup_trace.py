@@ -0,0 +1,36 @@
+"""
+Timestamps of app startup phases (eg. imports done, root widget built, first frame).
+
+Must be imported before anything else, since times are measured from its import.
+
+Example:
+>>> startup_trace.mark('kivy imported')
+>>> ..
+>>> print(startup_trace.report())
+"""
+
+
+import time
+
+
+_START = time.perf_counter()
+
+# [(phase name, seconds since start), ..]
+MARKS = []
+
+
+def mark(name):
+    """Records that phase `name` just ended."""
+    MARKS.append((name, time.perf_counter() - _START))
+
+
+def report():
+    """
+    :return: (str) One line per phase, with its end time and duration (ms).
+    """
+    lines = []
+    previous = 0.
+    for name, t in MARKS:
+        lines.append('{:<28}{:>9.1f} ms (+{:.1f} ms)'.format(name, t * 1000, (t - previous) * 1000))
+        previous = t
+    return '\n'.join(lines)
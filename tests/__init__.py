@@ -1 +1,8 @@
 REPETITIONS = 10 ** 4
+
+
+def exercise_2x_plus_1():
+    """`SolveForXLinear` of 2*x + 1 = 0 (solution -1/2)."""
+    from exercises import SolveForXLinear
+    from linear_equation import LinearEquation
+    return SolveForXLinear(difficulty=2, equation=LinearEquation(left_terms=[(2, True), (1, False)], right_terms=[]))
@@ -39,6 +39,15 @@ class Test__is_allowed_special_or_sympifiable_answer(TestCase):
             Exercise._is_allowed_special_or_sympifiable_answer(answer_val=NoSolution, allowed_answer_types=[AnyNumber]))
 
 
+    def test_plain_numbers_not_sympified(self):
+        from unittest import mock
+        with mock.patch('exercises.sympify') as sympify_mock:
+            for n in ['4', '-4.2', '+1/3']:
+                self.assertTrue(Exercise._is_allowed_special_or_sympifiable_answer(answer_val=n,
+                                                                                   allowed_answer_types=[]))
+            self.assertFalse(sympify_mock.called)
+
+
 class Test__is_correct_answer(TestCase):
     def test_sympy_number_is_correct(self):
         expected_a = '4'
@@ -62,3 +71,78 @@ class Test__is_correct_answer(TestCase):
         self.assertFalse(Exercise._is_correct_answer(answer=AnyNumber, expected_answer='4'))
         self.assertFalse(Exercise._is_correct_answer(answer='4', expected_answer=AnyNumber))
 
+
+    def test_plain_numbers_not_sympified(self):
+        from unittest import mock
+        from fractions import Fraction
+        with mock.patch('exercises.sympify') as sympify_mock:
+            self.assertTrue(Exercise._is_correct_answer(answer='-0.5', expected_answer=Fraction(-1, 2)))
+            self.assertTrue(Exercise._is_correct_answer(answer='2/4', expected_answer='0.5'))
+            self.assertFalse(Exercise._is_correct_answer(answer='1/3', expected_answer=Fraction(1, 2)))
+            self.assertFalse(sympify_mock.called)
+
+    def test_tolerance_same_as_sympy_path(self):
+        import sympy
+        from fractions import Fraction
+        expected_a = Fraction(-7, 3)
+        for a in ['-2.333', '-2.3333', '-2.336', '-2.3315', '-2.33', '-7/3', '7/3', '0.001', '0']:
+            self.assertEqual(Exercise._is_correct_answer(answer=a, expected_answer=expected_a),
+                             Exercise._is_correct_answer(answer=sympy.sympify(a),
+                                                         expected_answer=sympy.Rational(-7, 3)),
+                             msg=a)
+
+    def test_literals_same_as_sympy_path(self):
+        for a in ['7', '007', '\u0667', '\u0667/2', '00', '00.5', '-0.07', '1/007', '10/2', '0/5']:
+            try:
+                val = sympy.sympify(a)
+            except sympy.SympifyError:
+                val = None
+            self.assertEqual(Exercise._is_allowed_special_or_sympifiable_answer(a, allowed_answer_types=()),
+                             val is not None, msg=a)
+            if val is not None:
+                self.assertTrue(Exercise._is_correct_answer(answer=a, expected_answer=val), msg=a)
+
+    def test_absolute_tolerance_near_0(self):
+        self.assertTrue(Exercise._is_correct_answer(answer='0.0009', expected_answer='0'))
+        self.assertFalse(Exercise._is_correct_answer(answer='0.002', expected_answer='0'))
+
+
+class Test_answer_latex(TestCase):
+    def test_rationals_same_as_sympy(self):
+        from fractions import Fraction
+        from exercises import rational_latex
+        for p in range(-10, 11):
+            for q in range(1, 11):
+                f = Fraction(p, q)
+                self.assertEqual(rational_latex(f.numerator, f.denominator), sympy.latex(sympy.Rational(p, q)))
+
+    def test_same_as_sympy(self):
+        from fractions import Fraction
+        from exercises import answer_latex
+        for v in [Fraction(-1, 2), Fraction(3), -4, sympy.Rational(7, 3), 0.5, '2.5', '-1/3', sympy.sqrt(2)]:
+            self.assertEqual(answer_latex(v), sympy.latex(sympy.sympify(v)), msg=v)
+
+    def test_rationals_not_sympified(self):
+        from unittest import mock
+        from fractions import Fraction
+        from exercises import answer_latex
+        with mock.patch('exercises.sympify') as sympify_mock:
+            answer_latex(Fraction(-9, 7))
+            answer_latex(sympy.Rational(9, 7))
+            self.assertFalse(sympify_mock.called)
+
+    def test_cache_counters(self):
+        from fractions import Fraction
+        from exercises import answer_latex, answer_latex_cache_info
+        answer_latex(Fraction(-3, 11))
+        before = answer_latex_cache_info()
+        answer_latex(Fraction(-3, 11))
+        answer_latex(sympy.Rational(-3, 11))
+        after = answer_latex_cache_info()
+        self.assertEqual(after.hits - before.hits, 2)
+        self.assertEqual(after.misses, before.misses)
+
+    def test_default_convert_to_latex(self):
+        from fractions import Fraction
+        self.assertEqual(Exercise._default_simpify_and_convert_to_latex({'x': Fraction(-1, 2), 'y': NoSolution}),
+                         {'x': '- \\frac{1}{2}', 'y': NoSolution})
@@ -0,0 +1,64 @@
+import os
+import tempfile
+from unittest import TestCase
+
+import numpy
+
+from exercise_bank import ExerciseBank
+from exercises import SolveForXLinear
+
+
+class Test_ExerciseBank(TestCase):
+    def test_generate(self):
+        for d in SolveForXLinear.ALLOWED_DIFFICULTIES:
+            bank = ExerciseBank.generate(n=50, difficulty=d, seed=3)
+            self.assertEqual(len(bank), 50)
+            for i in range(len(bank)):
+                inst = bank[i]
+                self.assertIsInstance(inst, SolveForXLinear)
+                self.assertEqual(inst.difficulty, d)
+                self.assertEqual(bank.solution(i), inst.expected_answers['x'])
+
+    def test_same_exercises_as_generate_batch(self):
+        bank = ExerciseBank.generate(n=30, difficulty=3, seed=9)
+        batch = SolveForXLinear.generate_batch(n=30, difficulty=3, seed=9)
+        self.assertEqual([bank[i].question for i in range(30)], [inst.question for inst in batch])
+
+    def test_from_exercises(self):
+        exercises_lst = [SolveForXLinear(difficulty=d) for d in [1, 2, 3, 3]]
+        exercises_lst.append(SolveForXLinear(difficulty=3, x_terms=5, non_x_terms=4))
+        bank = ExerciseBank.from_exercises(exercises_lst)
+        for i, inst in enumerate(exercises_lst):
+            self.assertEqual(bank[i].question, inst.question)
+            self.assertEqual(bank[i].difficulty, inst.difficulty)
+            self.assertEqual(bank.solution(i), inst.expected_answers['x'])
+
+    def test_from_exercises_unparsable_question(self):
+        inst = SolveForXLinear()
+        inst.question = '0.5*x=1'
+        inst._create_remaining_data_based_on_question()
+        self.assertRaisesRegex(ValueError, 'Exercise 1 .*0.5\\*x=1', ExerciseBank.from_exercises,
+                               [SolveForXLinear(), inst])
+
+    def test_save_and_load_memory_mapped(self):
+        bank = ExerciseBank.generate(n=100, difficulty=3, seed=1)
+        with tempfile.TemporaryDirectory() as dir_path:
+            path = os.path.join(dir_path, 'bank.npz')
+            bank.save(path)
+            loaded = ExerciseBank.load(path)
+            self.assertIsInstance(loaded.array, numpy.memmap)
+            self.assertFalse(loaded.array.flags.writeable)
+            self.assertEqual([loaded[i].question for i in range(100)], [bank[i].question for i in range(100)])
+            del loaded
+
+    def test_save_and_load_without_extension(self):
+        bank = ExerciseBank.generate(n=20, difficulty=2, var_name='y', seed=2)
+        with tempfile.TemporaryDirectory() as dir_path:
+            path = os.path.join(dir_path, 'bank')
+            bank.save(path)
+            for mmap in (True, False):
+                loaded = ExerciseBank.load(path, mmap=mmap)
+                self.assertEqual(loaded.var_name, 'y')
+                self.assertEqual([loaded[i].question for i in range(20)], [bank[i].question for i in range(20)])
+                self.assertIn('y', loaded[0].question)
+                del loaded
@@ -0,0 +1,66 @@
+from unittest import TestCase
+
+from sympy import sympify
+
+from arbitrary_pieces import solve_1rst_degree_poly, AnyNumber, NoSolution
+from exercises import SolveForXLinear
+from linear_equation import LinearEquation
+from tests import REPETITIONS
+
+
+def _sympy_solution(question):
+    left_str, right_str = question.split('=')
+    return solve_1rst_degree_poly(sympify(left_str) - sympify(right_str))
+
+
+class Test_solution(TestCase):
+    def test_matches_sympy_solution(self):
+        for _ in range(REPETITIONS // 100):
+            for d in SolveForXLinear.ALLOWED_DIFFICULTIES:
+                eq = SolveForXLinear.random_equation(difficulty=d)
+                expected = _sympy_solution(eq.question)
+                if expected in (AnyNumber, NoSolution):
+                    self.assertIs(eq.solution, expected, eq.question)
+                else:
+                    self.assertEqual(sympify(eq.solution), expected, eq.question)
+
+    def test_special_solutions(self):
+        self.assertIs(LinearEquation.from_string('0*x+0=0').solution, AnyNumber)
+        self.assertIs(LinearEquation.from_string('2*x-1=2*x-1').solution, AnyNumber)
+        self.assertIs(LinearEquation.from_string('0*x-1=0').solution, NoSolution)
+
+
+class Test_question(TestCase):
+    def test_same_format_as_terms_joined(self):
+        eq = LinearEquation(left_terms=[(3, True), (-6, False)], right_terms=[])
+        self.assertEqual(eq.question, '3*x-6=0')
+        self.assertEqual(eq.question_in_latex, '$3x-6=0$')
+
+    def test_var_name(self):
+        eq = LinearEquation(left_terms=[], right_terms=[(1, True), (4, False)], var_name='y')
+        self.assertEqual(eq.question, '0=1*y+4')
+
+
+class Test_from_string(TestCase):
+    def test_round_trip_of_generated_questions(self):
+        for _ in range(REPETITIONS // 100):
+            for d in SolveForXLinear.ALLOWED_DIFFICULTIES:
+                eq = SolveForXLinear.random_equation(difficulty=d)
+                self.assertEqual(LinearEquation.from_string(eq.question), eq)
+
+    def test_lone_x(self):
+        eq = LinearEquation.from_string('-x+2=x')
+        self.assertEqual(eq.coefficients(), (-2, 2))
+
+    def test_invalid(self):
+        for q in ['2*x', '2*x=', '=1', '2**x=1', '2*(x+1)=0', '2x+-1=0', '1=2=3']:
+            self.assertRaises(ValueError, LinearEquation.from_string, q)
+
+
+class Test_question_and_latex(TestCase):
+    def test_same_as_uncached(self):
+        from linear_equation import question_and_latex, question_string, question_in_latex
+        left, right = ((3, True), (-2, False)), ((4, False),)
+        question = question_string(left, right, var_name='y')
+        self.assertEqual(question_and_latex(left, right, var_name='y'), (question, question_in_latex(question)))
+        self.assertEqual(LinearEquation(left, right, var_name='y').question_in_latex, '$3y-2=4$')
@@ -6,58 +6,37 @@ from arbitrary_pieces import AnyNumber, NoSolution
 from tests import REPETITIONS
 
 
-class Test__x_terms_strings(TestCase):
+class Test__terms_coefficients(TestCase):
     def setUp(self):
-        self.terms = set()
+        self.coefficients = set()
         for i in range(1, 5):
-            self.terms.update(SolveForXLinear()._x_terms_strings(x_terms=i))
+            self.coefficients.update(SolveForXLinear._x_terms_coefficients(x_terms=i))
+            self.coefficients.update(SolveForXLinear._non_x_terms_coefficients(non_x_terms=i))
 
-    def test_non_empty(self):
-        for t in self.terms:
-            self.assertTrue(t)
+    def test_non_zero_ints_within_10(self):
+        for c in self.coefficients:
+            self.assertIsInstance(c, int)
+            self.assertNotEqual(c, 0)
+            self.assertLessEqual(abs(c), 10)
 
-    def test_minus_digits_times_x_format(self):
-        for t in self.terms:
-            match = re.search(r'-?\d+\*x', t)   # e.g "-21*x", "21*x"
-            self.assertTrue(match, t)
 
-
-class Test__non_x_terms_strings(TestCase):
-    def setUp(self):
-        self.terms = set()
-        for i in range(1, 5):
-            self.terms.update(SolveForXLinear()._non_x_terms_strings(non_x_terms=i))
-
-    def test_non_empty(self):
-        for t in self.terms:
-            self.assertTrue(t)
-
-    def test_minus_digits_format(self):
-        for t in self.terms:
-            match = re.search(r'-?\d+', t)   # e.g "-21", "21"
-            self.assertTrue(match, t)
-
-
-class Test__hard_diff_left_and_right(TestCase):
+class Test__hard_diff_left_and_right_terms(TestCase):
     def test_at_least_one_side_non_empty(self):
         for i in range(1, 5):
-            l, r = SolveForXLinear()._hard_diff_left_and_right(x_terms=i, non_x_terms=i)
+            l, r = SolveForXLinear._hard_diff_left_and_right_terms(x_terms=i, non_x_terms=i)
             self.assertTrue(l or r)
 
     def test_n_x_terms(self):
         n_x_terms = 6
         for _ in range(REPETITIONS // 100):
-            l, r = SolveForXLinear()._hard_diff_left_and_right(x_terms=n_x_terms, non_x_terms=3)
-
-            x_terms = re.findall(r'\d+\*x', l+r)
-            self.assertEqual(len(x_terms), n_x_terms, (l, r))
+            l, r = SolveForXLinear._hard_diff_left_and_right_terms(x_terms=n_x_terms, non_x_terms=3)
+            self.assertEqual(sum(1 for _, has_x in l + r if has_x), n_x_terms, (l, r))
 
     def test_n_non_x_terms(self):
         n_non_x_terms = 6
         for _ in range(REPETITIONS // 100):
-            l, r = SolveForXLinear()._hard_diff_left_and_right(x_terms=3, non_x_terms=n_non_x_terms)
-            non_x_terms = re.findall(r'\d+(?!\d*\*x)', '='.join([l, r]))
-            self.assertEqual(len(non_x_terms), n_non_x_terms, (l, r, non_x_terms))
+            l, r = SolveForXLinear._hard_diff_left_and_right_terms(x_terms=3, non_x_terms=n_non_x_terms)
+            self.assertEqual(sum(1 for _, has_x in l + r if not has_x), n_non_x_terms, (l, r))
 
 
 class Test_question(TestCase):
@@ -129,3 +108,112 @@ class Test__check_all_answers(TestCase):
         return self._test_answer_correctness_base(dct=dct, true_or_false_assertion=False)
 
 
+
+
+class Test_rng(TestCase):
+    def test_same_seed_same_exercise(self):
+        import random
+        for d in SolveForXLinear.ALLOWED_DIFFICULTIES:
+            for seed in range(20):
+                q1 = SolveForXLinear(difficulty=d, rng=random.Random(seed)).question
+                q2 = SolveForXLinear(difficulty=d, rng=random.Random(seed)).question
+                self.assertEqual(q1, q2)
+
+    def test_numpy_generator(self):
+        import numpy
+        for d in SolveForXLinear.ALLOWED_DIFFICULTIES:
+            q1 = SolveForXLinear(difficulty=d, rng=numpy.random.default_rng(4)).question
+            q2 = SolveForXLinear(difficulty=d, rng=numpy.random.default_rng(4)).question
+            self.assertEqual(q1, q2)
+
+    def test_rng_not_kept(self):
+        import random
+        inst = SolveForXLinear(difficulty=3, rng=random.Random(1))
+        self.assertNotIn(random.Random, [type(v) for v in vars(inst).values()])
+
+
+class Test__is_valid_answer(TestCase):
+    def test_valid(self):
+        inst = SolveForXLinear()
+        for a in ['2', '-2', '+0.5', '-1/2', AnyNumber, NoSolution]:
+            self.assertTrue(inst._is_valid_answer(answer=a), a)
+
+    def test_invalid(self):
+        inst = SolveForXLinear()
+        for a in ['(1)/2', '1.0/2', '2*x', '1/2+1', '', '--1']:
+            self.assertFalse(inst._is_valid_answer(answer=a), a)
+
+    def test_validator_cached_on_class(self):
+        self.assertIs(SolveForXLinear._answer_validator(), SolveForXLinear._answer_validator())
+        self.assertIn('_ANSWER_VALIDATOR', SolveForXLinear.__dict__)
+
+    def test_no_allowed_patterns_nothing_valid(self):
+        class NoPatterns(SolveForXLinear):
+            ALLOWED_ANSWER_PATTERNS = ()
+
+        inst = NoPatterns()
+        for a in ['', '2']:
+            self.assertFalse(inst._is_valid_answer(answer=a), a)
+
+
+class Test_grade_many(TestCase):
+    def _inst(self, question):
+        inst = SolveForXLinear()
+        inst.question = question
+        inst._create_remaining_data_based_on_question()
+        return inst
+
+    def test_verdicts(self):
+        inst = self._inst('2*x-1=0')
+        submissions = [{'x': '1/2'}, {'x': '-1/2'}, {'x': '0.5'}, {'x': '(1)/2'}, {'x': AnyNumber}, {'x': '0.5004'}]
+        self.assertEqual(inst.grade_many(submissions), [True, False, True, False, False, True])
+
+    def test_same_as_check_all_answers(self):
+        inst = self._inst('3*x+1=x')
+        submissions = [{'x': a} for a in ['-1/2', '-0.5', '1/2', '-2/4', '-0.501', '', '2+1', NoSolution]]
+        self.assertEqual(inst.grade_many(submissions),
+                         [inst.check_all_answers(s) for s in submissions])
+
+    def test_special_answers(self):
+        inst = self._inst('0*x-1=0')
+        self.assertEqual(inst.grade_many([{'x': NoSolution}, {'x': AnyNumber}, {'x': '1'}]), [True, False, False])
+
+    def test_leading_zeros_and_non_ascii_digits_rejected(self):
+        inst = self._inst('1*x-7=0')
+        self.assertEqual(inst.grade_many([{'x': '7'}, {'x': '007'}, {'x': '\u0667'}]), [True, False, False])
+
+    def test_cache_follows_replaced_question(self):
+        inst = self._inst('2*x-1=0')
+        self.assertEqual(inst.grade_many([{'x': '1/2'}]), [True])
+        inst.question = '2*x-2=0'
+        inst._create_remaining_data_based_on_question()
+        self.assertEqual(inst.grade_many([{'x': '1/2'}, {'x': '1'}]), [False, True])
+
+
+class Test_question_not_parsed(TestCase):
+    def test_solved_with_sympy(self):
+        inst = SolveForXLinear()
+        for q, correct, incorrect in [('0.5*x=1', '2', '1/2'), ('2*(x+1)=0', '-1', '1'), ('x/3-1=0', '3', '1/3')]:
+            inst.question = q
+            inst._create_remaining_data_based_on_question()
+            self.assertEqual(inst.grade_many([{'x': correct}, {'x': incorrect}]), [True, False], q)
+            self.assertEqual(inst.question_in_latex, '${}$'.format(q.replace('*', '')))
+
+
+class Test__question_equation(TestCase):
+    def test_parsed_once_per_question(self):
+        from unittest import mock
+        from linear_equation import LinearEquation
+        inst = SolveForXLinear()
+        inst.question = '3x = 6'
+        with mock.patch.object(LinearEquation, 'from_string', wraps=LinearEquation.from_string) as from_string:
+            eq = inst._question_equation()
+            self.assertIs(inst._question_equation(), eq)
+            self.assertEqual(from_string.call_count, 1)
+        self.assertEqual(eq.solution, 2)
+
+    def test_failed_parse_drops_previous_equation(self):
+        inst = SolveForXLinear()
+        inst.question = '0.5*x=1'
+        self.assertIsNone(inst._question_equation())
+        self.assertIsNone(inst.equation)
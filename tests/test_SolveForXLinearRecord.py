@@ -0,0 +1,54 @@
+import random
+from unittest import TestCase
+
+from exercises import SolveForXLinear, SolveForXLinearRecord
+
+
+class Test_SolveForXLinearRecord(TestCase):
+    def test_no_instance_dict(self):
+        record = SolveForXLinearRecord.from_seed(seed=1, difficulty=3)
+        self.assertFalse(hasattr(record, '__dict__'))
+
+    def test_same_data_as_exercise(self):
+        for d in SolveForXLinear.ALLOWED_DIFFICULTIES:
+            for seed in range(20):
+                inst = SolveForXLinear(difficulty=d, rng=random.Random(seed))
+                record = SolveForXLinearRecord.from_seed(seed=seed, difficulty=d)
+                for attr in ['question', 'question_in_latex', 'question_title',
+                             'expected_answers', 'expected_answers_in_latex']:
+                    self.assertEqual(getattr(record, attr), getattr(inst, attr), attr)
+
+    def test_data_calculated_lazily(self):
+        record = SolveForXLinearRecord.from_seed(seed=2, difficulty=2)
+        self.assertRaises(AttributeError, getattr, record, '_question')
+        self.assertRaises(AttributeError, getattr, record, '_expected_answers_in_latex')
+        _ = record.question
+        self.assertIs(record.question, record._question)
+        self.assertRaises(AttributeError, getattr, record, '_expected_answers_in_latex')
+
+    def test_from_exercise_round_trip(self):
+        for d in SolveForXLinear.ALLOWED_DIFFICULTIES:
+            inst = SolveForXLinear(difficulty=d)
+            record = SolveForXLinearRecord.from_exercise(inst)
+            self.assertEqual(record.to_exercise().question, inst.question)
+
+    def test_to_exercise_custom_terms(self):
+        inst = SolveForXLinear(difficulty=3, x_terms=1, non_x_terms=5)
+        new_inst = SolveForXLinearRecord.from_exercise(inst).to_exercise()
+        self.assertEqual((new_inst.x_terms, new_inst.non_x_terms), (1, 5))
+
+    def test_original_question_kept(self):
+        inst = SolveForXLinear()
+        inst.question = '3x=6'
+        inst._create_remaining_data_based_on_question()
+        record = SolveForXLinearRecord.from_exercise(inst)
+        self.assertEqual(record.question, '3x=6')
+        self.assertEqual(record.expected_answers, inst.expected_answers)
+        new_inst = record.to_exercise()
+        self.assertEqual((new_inst.question, new_inst.expected_answers), ('3x=6', inst.expected_answers))
+
+    def test_unparsable_question(self):
+        inst = SolveForXLinear()
+        inst.question = '0.5*x=1'
+        inst._create_remaining_data_based_on_question()
+        self.assertRaisesRegex(ValueError, '0.5\\*x=1', SolveForXLinearRecord.from_exercise, inst)
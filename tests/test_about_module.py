@@ -0,0 +1,28 @@
+import os
+import subprocess
+import sys
+from unittest import TestCase
+
+import about_module
+
+
+class Test_licenses(TestCase):
+    def test_project_license_first(self):
+        names = list(about_module.license_paths())
+        self.assertEqual(names[0], about_module.APP_NAME)
+        self.assertIn('kivy', names)
+
+    def test_paths_exist(self):
+        for path in about_module.license_paths().values():
+            self.assertTrue(os.path.isfile(path), msg=path)
+
+    def test_text(self):
+        with open(about_module.PROJECT_LICENSE_PATH) as f:
+            self.assertEqual(about_module.license_text(about_module.APP_NAME), f.read())
+        self.assertRaises(KeyError, about_module.license_text, 'missing')
+
+    def test_import_doesnt_import_main(self):
+        code = 'import sys, about_module; print("main" in sys.modules)'
+        out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                             cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))).stdout
+        self.assertEqual(out.strip(), 'False')
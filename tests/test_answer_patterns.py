@@ -46,6 +46,27 @@ class Test_total_matches_within_bounds(TestCase):
             self.assertRaises(ValueError, _PatternBase.total_matches_within_bounds, randint(1, 1000), i)
 
 
+class Test_bounds_predicate(TestCase):
+    def test_cached(self):
+        self.assertIs(answer_patterns.bounds_predicate('2<=m<3'), answer_patterns.bounds_predicate('2<=m<3'))
+
+    def test_same_as_bounds_str(self):
+        for bounds_str in ['m>2', 'm<=1', 'm>=10', 'm==0', 'm!=5', '2<=m<15', '3>m!=1']:
+            predicate = answer_patterns.bounds_predicate(bounds_str)
+            for m in range(20):
+                self.assertEqual(predicate(m), _PatternBase.total_matches_within_bounds(m=m, bounds_str=bounds_str))
+
+    def test_found_m_patterns_accepts_predicate(self):
+        predicate = answer_patterns.bounds_predicate('m==2')
+        self.assertTrue(answer_patterns.found_m_patterns(compile_obj=compile(r'a'), expr='a-a', bounds_str=predicate))
+
+    def test_found_m_patterns_beyond_bounds(self):
+        expr = 'a' * 100
+        for bounds_str, expected in {'m<3': False, 'm>3': True, 'm==3': False, 'm!=3': True, '1<m<=99': False}.items():
+            self.assertEqual(answer_patterns.found_m_patterns(compile_obj=compile(r'a'), expr=expr, bounds_str=bounds_str),
+                             expected, bounds_str)
+
+
 class Test__check_duplicates_and_note_new_pattern(TestCase):
     FILLER_ARGS = ([''],[''],[''])
 
@@ -67,6 +88,40 @@ class Test_PatternBase(TestCase):
         self.assertRaises(TypeError, _PatternBase, '\d+', *self.FILLER_ARGS)
 
 
+class Test_compiled_patterns(TestCase):
+    def test_same_as_pattern_strings(self):
+        for p in [answer_patterns.INTEGER, answer_patterns.DECIMAL, answer_patterns.FRACTION_OF_INTS]:
+            for s in list(p.fullmatch) + list(p.no_fullmatch) + ['-2', '+1/3', '-0.5', '--2']:
+                self.assertEqual(bool(p.compiled.fullmatch(s)), bool(fullmatch(p, s)))
+                self.assertEqual(bool(p.with_sign_compiled.fullmatch(s)), bool(fullmatch(p.with_sign, s)))
+
+
+class Test_any_fullmatch_validator(TestCase):
+    def test_fullmatches_if_any_pattern_does(self):
+        patterns = [answer_patterns.INTEGER.with_sign, answer_patterns.FRACTION_OF_INTS.with_sign]
+        validator = answer_patterns.any_fullmatch_validator(patterns)
+        for s in ['2', '-2', '+1/3', '1.2', '1/3/4', 'x', '', '2+1', '-1/3+2']:
+            expected = any(fullmatch(p, s) for p in patterns)
+            self.assertEqual(bool(validator.fullmatch(s)), expected, s)
+
+    def test_no_patterns_never_match(self):
+        validator = answer_patterns.any_fullmatch_validator([])
+        for s in ['', '2', 'x']:
+            self.assertIsNone(validator.fullmatch(s), s)
+
+
+class Test_numeric_literal_value(TestCase):
+    def test_plain_numbers(self):
+        from fractions import Fraction
+        dct = {'2': Fraction(2), '-2': Fraction(-2), '+0.25': Fraction(1, 4), '-1/3': Fraction(-1, 3), '0.0': 0}
+        for expr, val in dct.items():
+            self.assertEqual(answer_patterns.numeric_literal_value(expr), val, expr)
+
+    def test_not_plain_numbers(self):
+        for expr in ['2+1', '(1)/2', '1/0', 'x', '', '--2', '1.0/2', '2*3', '007', '1/02', '\u0667']:
+            self.assertIsNone(answer_patterns.numeric_literal_value(expr), expr)
+
+
 # ---------------------------------------------------------------------------------
 class TestEachPattern(TestCase):
     # fullmatch test-base
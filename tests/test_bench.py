@@ -0,0 +1,40 @@
+import json
+from unittest import TestCase
+
+from bench import run as bench_run
+
+
+class Test_stats(TestCase):
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(bench_run.percentile(values, 50), 50)
+        self.assertEqual(bench_run.percentile(values, 99), 99)
+        self.assertEqual(bench_run.percentile(values, 100), 100)
+        self.assertEqual(bench_run.percentile([7], 99), 7)
+
+    def test_latency_stats(self):
+        stats = bench_run.latency_stats([0.002, 0.001, 0.001, 0.004])
+        self.assertEqual(stats['n'], 4)
+        self.assertAlmostEqual(stats['throughput_per_s'], 500)
+        self.assertAlmostEqual(stats['p50_us'], 1000)
+        self.assertAlmostEqual(stats['p99_us'], 4000)
+
+
+class Test_run(TestCase):
+    def test_all_benchmarks_json_serializable(self):
+        results = bench_run.run(n=12)
+        self.assertEqual(set(results['results']), set(bench_run.BENCHMARKS))
+        json.dumps(results)
+        for stats in results['results'].values():
+            self.assertLessEqual(stats['p50_us'], stats['p99_us'])
+
+    def test_check_stages(self):
+        stages = bench_run.run(names=['check_stages'], n=10)['results']['check_stages']['stages']
+        self.assertEqual(set(stages), {'validation', 'sympify', 'comparison'})
+
+    def test_compare(self):
+        results = bench_run.run(names=['r_int'], n=10)
+        self.assertEqual(bench_run.compare(results, results), {'r_int': 1.})
+
+    def test_unknown_benchmark(self):
+        self.assertRaises(ValueError, bench_run.run, names=['missing'])
@@ -0,0 +1,72 @@
+import io
+from contextlib import redirect_stdout
+from unittest import TestCase
+
+import check_tracing
+from check_tracing import RingBufferCollector
+from exercises import Exercise
+from tests import exercise_2x_plus_1
+
+
+class Test_check_observers(TestCase):
+    def setUp(self):
+        self.collector = RingBufferCollector(maxlen=3)
+        Exercise.add_check_observer(self.collector)
+        self.exercise = exercise_2x_plus_1()
+
+    def tearDown(self):
+        Exercise.remove_check_observer(self.collector)
+
+    def test_event(self):
+        self.assertTrue(self.exercise.check_all_answers({'x': '-1/2'}))
+        event, = self.collector
+        self.assertEqual(event.exercise_id, id(self.exercise))
+        self.assertEqual(event.exercise_class, 'SolveForXLinear')
+        self.assertEqual(event.question, self.exercise.question)
+        self.assertEqual(event.answers, {'x': '-1/2'})
+        self.assertTrue(event.verdict)
+        self.assertEqual(set(event.timings), set(check_tracing.STAGES))
+        self.assertGreaterEqual(event.total, sum(event.timings.values()))
+        for stage in check_tracing.STAGES:
+            self.assertGreaterEqual(event.timings[stage], 0)
+
+    def test_answers_snapshot(self):
+        answers = {'x': '-1/2'}
+        self.exercise.check_all_answers(answers)
+        answers['x'] = '-1/27'
+        event, = self.collector
+        self.assertEqual(event.answers, {'x': '-1/2'})
+
+    def test_invalid_answer_not_compared(self):
+        self.assertFalse(self.exercise.check_all_answers({'x': '1+1'}))
+        event, = self.collector
+        self.assertFalse(event.verdict)
+        self.assertGreaterEqual(event.timings[check_tracing.VALIDATION], 0)
+        self.assertEqual(event.timings[check_tracing.COMPARISON], 0)
+
+    def test_grade_many_events(self):
+        self.assertEqual(self.exercise.grade_many([{'x': '-0.5'}, {'x': '2'}]), [True, False])
+        self.assertEqual([e.verdict for e in self.collector], [True, False])
+
+    def test_ring_buffer_keeps_latest(self):
+        for answer in ['1', '2', '3', '-1/2']:
+            self.exercise.check_all_answers({'x': answer})
+        self.assertEqual(len(self.collector), 3)
+        self.assertEqual([e.answers['x'] for e in self.collector], ['2', '3', '-1/2'])
+        self.assertEqual(len(self.collector.stage_times(check_tracing.SYMPIFY)), 3)
+        self.collector.clear()
+        self.assertEqual(len(self.collector), 0)
+
+    def test_removed_observer(self):
+        Exercise.remove_check_observer(self.collector)
+        self.exercise.check_all_answers({'x': '-1/2'})
+        Exercise.add_check_observer(self.collector)
+        self.assertEqual(len(self.collector), 0)
+
+
+class Test_check_all_answers(TestCase):
+    def test_nothing_printed(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.assertTrue(exercise_2x_plus_1().check_all_answers({'x': '-1/2'}))
+        self.assertEqual(out.getvalue(), '')
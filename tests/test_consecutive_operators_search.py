@@ -1,6 +1,6 @@
 from unittest import TestCase
 
-from arbitrary_pieces import consecutive_operators_search
+from arbitrary_pieces import consecutive_operators_search, consecutive_operators_search_many
 
 
 class Test__consecutive_operators_search(TestCase):
@@ -13,3 +13,17 @@ class Test__consecutive_operators_search(TestCase):
         expressions = ['1+(-2)+4-x', '4/(-2)*8', '(-4*2+1)', ]
         for expr in expressions:
             self.assertFalse(consecutive_operators_search(expr=expr))
+
+    def test_finds_all_pairs(self):
+        import itertools
+        for op1, op2 in itertools.product('+-/*', repeat=2):
+            expr = '1{}{}2'.format(op1, op2)
+            self.assertEqual(consecutive_operators_search(expr=expr).group(), op1 + op2)
+
+
+class Test_consecutive_operators_search_many(TestCase):
+    def test_same_as_single_search(self):
+        expressions = ['*/', '1+(-2)+4-x', '2-+1', '', '4/(-2)*8', '1**2']
+        found = consecutive_operators_search_many(expressions)
+        self.assertEqual([bool(m) for m in found],
+                         [bool(consecutive_operators_search(expr=e)) for e in expressions])
@@ -0,0 +1,22 @@
+from unittest import TestCase
+
+import ipython_ui
+from ipython_ui.qa_display_widgets import FillGapsBox
+
+
+class Test_display_class(TestCase):
+    def test_resolves_registered_key(self):
+        self.assertIs(ipython_ui.display_class('fill_gaps'), FillGapsBox)
+
+    def test_unknown_key(self):
+        self.assertRaises(KeyError, ipython_ui.display_class, 'not_registered')
+
+    def test_non_display_class_rejected(self):
+        ipython_ui.register_display_class('_not_a_box', 'languages:Message')
+        try:
+            self.assertRaises(TypeError, ipython_ui.display_class, '_not_a_box')
+        finally:
+            del ipython_ui.DISPLAY_CLASSES_PATHS['_not_a_box']
+
+    def test_duplicate_key(self):
+        self.assertRaises(ValueError, ipython_ui.register_display_class, 'fill_gaps', 'a:B')
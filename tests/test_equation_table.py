@@ -0,0 +1,45 @@
+import collections
+import random
+from unittest import TestCase
+
+from arbitrary_pieces import AnyNumber, NoSolution
+from equation_table import EquationTable, table
+from linear_equation import LinearEquation
+
+
+class Test_EquationTable(TestCase):
+    def test_all_equations(self):
+        self.assertEqual(len(EquationTable.build(difficulty=1)), 5 * 10)
+        self.assertEqual(len(EquationTable.build(difficulty=2)), 21 * 21)
+        self.assertRaises(ValueError, EquationTable.build, difficulty=3)
+
+    def test_rows_same_as_equations(self):
+        for difficulty in (1, 2):
+            t = EquationTable.build(difficulty=difficulty, var_name='y')
+            for i, r in enumerate(t.rows):
+                eq = LinearEquation(left_terms=[(r.a, True), (r.b, False)], right_terms=[], var_name='y')
+                self.assertEqual(t.equation(i), eq)
+                self.assertEqual((r.question, r.question_in_latex, r.solution),
+                                 (eq.question, eq.question_in_latex, eq.solution))
+
+    def test_weights(self):
+        t = EquationTable.build(difficulty=2)
+        # (weight of a=0 is 2 and of b=0 is 4)
+        self.assertEqual(t.row(a=0, b=0).weight, 8)
+        self.assertEqual(t.row(a=0, b=3).solution, NoSolution)
+        self.assertEqual(t.row(a=0, b=0).solution, AnyNumber)
+        self.assertEqual(t.row(a=3, b=-3).weight, 1)
+
+    def test_odds_same_as_r_int(self):
+        t = EquationTable.build(difficulty=2)
+        reps = 20000
+        rng = random.Random(1)
+        counts = collections.Counter(t.random_equation(rng=rng).left_terms[0][0] == 0 for _ in range(reps))
+        # (a=0 has weight 2 out of 22)
+        self.assertAlmostEqual(counts[True] / reps, 2 / 22, delta=.01)
+
+    def test_same_seed_same_equations(self):
+        t = table(difficulty=1)
+        rng1, rng2 = random.Random(3), random.Random(3)
+        self.assertEqual([t.random_equation(rng=rng1) for _ in range(20)],
+                         [t.random_equation(rng=rng2) for _ in range(20)])
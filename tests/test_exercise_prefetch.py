@@ -0,0 +1,76 @@
+import threading
+import time
+from unittest import TestCase
+
+from exercise_prefetch import ExercisePrefetcher
+from exercises import SolveForXLinear
+
+
+def _wait_until(condition, timeout=5.):
+    end = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > end:
+            raise AssertionError('Timed out.')
+        time.sleep(.001)
+
+
+class Test_ExercisePrefetcher(TestCase):
+    def setUp(self):
+        self.threads = []
+        self.prefetcher = ExercisePrefetcher(factory=lambda: SolveForXLinear(difficulty=2), depth=3,
+                                             prepare=self._prepare)
+
+    def tearDown(self):
+        self.prefetcher.shutdown()
+
+    def _prepare(self, exercise):
+        self.threads.append(threading.current_thread())
+        return exercise.question_in_latex
+
+    def test_refill_up_to_depth(self):
+        self.prefetcher.refill()
+        self.prefetcher.refill()
+        _wait_until(lambda: len(self.prefetcher) == 3)
+        time.sleep(.05)
+        self.assertEqual(len(self.prefetcher), 3)
+        self.assertNotIn(threading.current_thread(), self.threads)
+
+    def test_pop_prefetched(self):
+        self.prefetcher.refill()
+        _wait_until(lambda: len(self.prefetcher) == 3)
+        exercise, prepared = self.prefetcher.pop()
+        self.assertIsInstance(exercise, SolveForXLinear)
+        self.assertEqual(prepared, exercise.question_in_latex)
+        self.assertEqual(len(self.prefetcher), 2)
+        self.prefetcher.refill()
+        _wait_until(lambda: len(self.prefetcher) == 3)
+
+    def test_pop_when_empty(self):
+        exercise, prepared = self.prefetcher.pop()
+        self.assertEqual(prepared, exercise.question_in_latex)
+        self.assertEqual(self.threads, [threading.current_thread()])
+
+    def test_pop_when_empty_without_preparing(self):
+        exercise, prepared = self.prefetcher.pop(prepare=False)
+        self.assertIsInstance(exercise, SolveForXLinear)
+        self.assertIsNone(prepared)
+        self.assertEqual(self.threads, [])
+
+    def test_worker_exception_raised_by_pop(self):
+        def prepare(exercise):
+            raise RuntimeError('render failed')
+
+        prefetcher = ExercisePrefetcher(factory=lambda: SolveForXLinear(difficulty=1), depth=1, prepare=prepare)
+        prefetcher.refill()
+        _wait_until(lambda: len(prefetcher) == 1)
+        self.assertRaisesRegex(RuntimeError, 'render failed', prefetcher.pop)
+        self.assertEqual(len(prefetcher), 0)
+        prefetcher.shutdown()
+
+    def test_without_prepare(self):
+        prefetcher = ExercisePrefetcher(factory=lambda: SolveForXLinear(difficulty=1), depth=1)
+        self.assertIsNone(prefetcher.pop()[1])
+        prefetcher.shutdown()
+
+    def test_invalid_depth(self):
+        self.assertRaises(ValueError, ExercisePrefetcher, factory=SolveForXLinear, depth=0)
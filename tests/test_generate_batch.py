@@ -0,0 +1,62 @@
+from unittest import TestCase
+
+from arbitrary_pieces import AnyNumber, NoSolution
+import equation_table
+from exercises import SolveForXLinear
+from linear_equation import LinearEquation
+from tests import REPETITIONS
+
+
+class Test_generate_batch(TestCase):
+    def test_n_exercises(self):
+        for d in SolveForXLinear.ALLOWED_DIFFICULTIES:
+            batch = SolveForXLinear.generate_batch(n=50, difficulty=d)
+            self.assertEqual(len(batch), 50)
+            for inst in batch:
+                self.assertIsInstance(inst, SolveForXLinear)
+                self.assertEqual(inst.difficulty, d)
+
+    def test_same_seed_same_exercises(self):
+        q1 = [i.question for i in SolveForXLinear.generate_batch(n=20, difficulty=3, seed=4)]
+        q2 = [i.question for i in SolveForXLinear.generate_batch(n=20, difficulty=3, seed=4)]
+        self.assertEqual(q1, q2)
+
+    def test_answers_match_questions(self):
+        for d in SolveForXLinear.ALLOWED_DIFFICULTIES:
+            for inst in SolveForXLinear.generate_batch(n=100, difficulty=d):
+                self.assertEqual(inst.expected_answers['x'], LinearEquation.from_string(inst.question).solution)
+
+    def test_d1_positive_int_solutions(self):
+        for inst in SolveForXLinear.generate_batch(n=100, difficulty=1):
+            sol = inst.expected_answers['x']
+            self.assertEqual(sol.denominator, 1)
+            self.assertGreater(sol, 0)
+
+    def test_same_equations_as_tables(self):
+        for d in equation_table.TABLE_DIFFICULTIES:
+            table_questions = {r.question for r in equation_table.table(difficulty=d).rows}
+            batch_questions = set(SolveForXLinear.generate_batch(n=REPETITIONS, difficulty=d, columnar=True).question)
+            self.assertLessEqual(batch_questions, table_questions)
+
+    def test_n_terms_on_d3(self):
+        for inst in SolveForXLinear.generate_batch(n=20, difficulty=3, x_terms=2, non_x_terms=5):
+            self.assertEqual(len(inst.equation.left_terms + inst.equation.right_terms), 7)
+
+    def test_special_answers_occur_often_enough_in_d2(self):
+        reps = REPETITIONS
+        answers = SolveForXLinear.generate_batch(n=reps, difficulty=2, columnar=True).expected_answer
+        detected = sum(1 for a in answers if a in (AnyNumber, NoSolution))
+        self.assertGreater(detected / reps, .05)
+        self.assertLess(detected / reps, .12)
+
+    def test_columnar_same_as_objects(self):
+        for d in SolveForXLinear.ALLOWED_DIFFICULTIES:
+            columns = SolveForXLinear.generate_batch(n=30, difficulty=d, seed=7, columnar=True)
+            batch = SolveForXLinear.generate_batch(n=30, difficulty=d, seed=7)
+            self.assertEqual(columns.question, [i.question for i in batch])
+            self.assertEqual(columns.question_in_latex, [i.question_in_latex for i in batch])
+            self.assertEqual(columns.expected_answer, [i.expected_answers['x'] for i in batch])
+
+    def test_disallowed_args(self):
+        self.assertRaises(ValueError, SolveForXLinear.generate_batch, 5, 4)
+        self.assertRaises(ValueError, SolveForXLinear.generate_batch, 5, 1, 'x', 4)
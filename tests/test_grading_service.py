@@ -0,0 +1,85 @@
+import asyncio
+import json
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from grading_service import GradingService
+from tests import exercise_2x_plus_1
+
+
+class Test_GradingService(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.service = GradingService()
+        self.exercise = exercise_2x_plus_1()
+        self.key = self.service.register(self.exercise)
+
+    async def test_verdicts(self):
+        verdicts = await asyncio.gather(self.service.submit(self.key, {'x': '-1/2'}),
+                                        self.service.submit(self.key, {'x': '-0.5'}),
+                                        self.service.submit(self.key, {'x': '1/2'}))
+        self.assertEqual(verdicts, [True, True, False])
+
+    async def test_concurrent_submissions_batched(self):
+        with patch.object(self.exercise, 'grade_many', wraps=self.exercise.grade_many) as grade_many:
+            verdicts = await asyncio.gather(*[self.service.submit(self.key, {'x': '-1/2'}) for _ in range(40)])
+        self.assertEqual(verdicts, [True] * 40)
+        self.assertEqual(grade_many.call_count, 1)
+
+    async def test_invalid_submission_fails_only_itself(self):
+        good = self.service.submit(self.key, {'x': '-1/2'})
+        bad = self.service.submit(self.key, {'y': '-1/2'})
+        self.assertTrue(await good)
+        with self.assertRaises(KeyError):
+            await bad
+
+    async def test_running_tasks_referenced(self):
+        import threading
+        release = threading.Event()
+        grade_many = self.exercise.grade_many
+
+        def blocked_grade_many(submissions):
+            release.wait(5)
+            return grade_many(submissions)
+
+        with patch.object(self.exercise, 'grade_many', side_effect=blocked_grade_many):
+            future = self.service.submit(self.key, {'x': '-1/2'})
+            while not self.service._tasks:
+                await asyncio.sleep(.001)
+            self.assertEqual(len(self.service._tasks), 1)
+            release.set()
+            self.assertTrue(await future)
+        await asyncio.sleep(0)
+        self.assertEqual(self.service._tasks, set())
+
+    async def test_unregistered_exercise(self):
+        self.assertRaises(KeyError, self.service.submit, 'missing', {'x': '1'})
+
+    async def test_queue(self):
+        queue = asyncio.Queue()
+        server_task = asyncio.ensure_future(self.service.serve_queue(queue))
+        loop = asyncio.get_running_loop()
+        replies = [loop.create_future() for _ in range(3)]
+        for reply, answer in zip(replies, ['-1/2', '-0.5', '3']):
+            await queue.put((self.key, {'x': answer}, reply))
+        self.assertEqual(await asyncio.gather(*replies), [True, True, False])
+        server_task.cancel()
+
+    async def test_socket_server(self):
+        server = await self.service.start_server()
+        host, port = server.sockets[0].getsockname()[:2]
+        reader, writer = await asyncio.open_connection(host, port)
+        requests = [{'id': 1, 'exercise': self.key, 'answers': {'x': '-1/2'}},
+                    {'id': 2, 'exercise': self.key, 'answers': {'x': '2'}},
+                    {'id': 3, 'exercise': 'missing', 'answers': {'x': '2'}}]
+        writer.write(''.join(json.dumps(r) + '\n' for r in requests).encode())
+        await writer.drain()
+        responses = {}
+        for _ in requests:
+            response = json.loads(await reader.readline())
+            responses[response['id']] = response
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        self.assertTrue(responses[1]['correct'])
+        self.assertFalse(responses[2]['correct'])
+        self.assertIn('error', responses[3])
@@ -0,0 +1,36 @@
+import subprocess
+import sys
+from unittest import TestCase
+
+import never_importer
+
+
+# Cumulative import time of `exercises` (microseconds).
+IMPORT_TIME_BUDGET_US = 500000
+HEAVY_MODULES = ('sympy', 'mpmath', 'IPython', 'ipywidgets', 'numpy', 'ipython_ui.qa_display_widgets')
+
+
+def _run_python(*args):
+    return subprocess.run([sys.executable] + list(args), cwd=never_importer.PROJECT_PATH,
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+
+
+def _cumulative_import_time_us(module_name):
+    """Cumulative time reported by `python -X importtime` (on a fresh interpreter)."""
+    output = _run_python('-X', 'importtime', '-c', 'import {}'.format(module_name)).stderr
+    for line in output.splitlines():
+        # eg. "import time:      7820 |      40709 | exercises"
+        _, cumulative, name = line.rsplit('|', 2)
+        if name.strip() == module_name:
+            return int(cumulative)
+    raise ValueError('{} not found in importtime output.'.format(module_name))
+
+
+class Test_import_time(TestCase):
+    def test_exercises_within_budget(self):
+        t = _cumulative_import_time_us('exercises')
+        self.assertLess(t, IMPORT_TIME_BUDGET_US)
+
+    def test_heavy_modules_not_imported(self):
+        code = 'import sys, exercises; print(",".join(m for m in {!r} if m in sys.modules))'.format(HEAVY_MODULES)
+        self.assertEqual(_run_python('-c', code).stdout.strip(), '')
@@ -0,0 +1,86 @@
+from unittest import TestCase
+
+from latex_rendering import RenderCache
+
+
+class Test_RenderCache(TestCase):
+    def setUp(self):
+        self.calls = []
+        self.cache = RenderCache(render_func=self._render, maxsize=2)
+
+    def _render(self, latex_str, font_size, dpi):
+        self.calls.append((latex_str, font_size, dpi))
+        return object()
+
+    def test_repeat_renders_cached(self):
+        im = self.cache.get('$x=-2$')
+        self.assertIs(self.cache.get('$x=-2$'), im)
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_key_includes_size_and_dpi(self):
+        self.cache.get('$x$', font_size=20, dpi=100)
+        self.cache.get('$x$', font_size=30, dpi=100)
+        self.cache.get('$x$', font_size=20, dpi=200)
+        self.assertEqual(len(self.calls), 3)
+
+    def test_least_recently_used_evicted(self):
+        self.cache.get('a')
+        self.cache.get('b')
+        self.cache.get('a')
+        self.cache.get('c')
+        self.assertEqual(len(self.cache), 2)
+        self.assertNotIn(('b', 20, 100), self.cache)
+        self.assertIn(('a', 20, 100), self.cache)
+
+    def test_clear(self):
+        self.cache.get('a')
+        self.cache.clear()
+        self.cache.get('a')
+        self.assertEqual(len(self.calls), 2)
+
+    def test_invalid_size(self):
+        self.assertRaises(ValueError, RenderCache, self._render, 0)
+
+
+class Test_render_rgba(TestCase):
+    def test_buffer_size(self):
+        from latex_rendering import render_rgba
+        im = render_rgba('$x=- \\frac{1}{2}$')
+        self.assertEqual(im.buffer.ndim, 1)
+        self.assertEqual(im.buffer.nbytes, im.width * im.height * 4)
+
+    def test_transparent_background(self):
+        import numpy
+        from latex_rendering import render_rgba
+        im = render_rgba('$x=-2$')
+        alpha = numpy.asarray(im.buffer).reshape(im.height, im.width, 4)[..., 3]
+        self.assertEqual(alpha[0, 0], 0)
+        self.assertEqual(alpha.max(), 255)
+
+    def test_bigger_font_bigger_image(self):
+        from latex_rendering import render_rgba
+        small, big = render_rgba('$3x-6=0$', font_size=10), render_rgba('$3x-6=0$', font_size=30)
+        self.assertGreater(big.width, small.width)
+        self.assertGreater(big.height, small.height)
+
+    def test_no_pyplot(self):
+        import sys
+        from latex_rendering import render_rgba
+        if 'matplotlib.pyplot' not in sys.modules:
+            render_rgba('$x$')
+            self.assertNotIn('matplotlib.pyplot', sys.modules)
+
+
+class Test_RasterizerPool(TestCase):
+    def test_concurrent_renders(self):
+        from latex_rendering import RasterizerPool, render_rgba
+        pool = RasterizerPool(max_workers=4)
+        strings = ['${}x-{}=0$'.format(i, i + 1) for i in range(12)]
+        images = pool.render_many(strings, font_size=15)
+        pool.shutdown()
+        self.assertEqual(set(images), {(s, 15, 100) for s in strings})
+        for (s, font_size, dpi), im in images.items():
+            expected = render_rgba(s, font_size=font_size, dpi=dpi)
+            self.assertEqual((im.width, im.height), (expected.width, expected.height))
+            self.assertEqual(bytes(im.buffer), bytes(expected.buffer))
@@ -0,0 +1,43 @@
+import time
+from unittest import TestCase
+
+from exercises import SolveForXLinear
+from parallel_generation import generate_exercises
+
+
+def _questions(**kwargs):
+    return [inst.question for inst in generate_exercises(**kwargs)]
+
+
+class Test_generate_exercises(TestCase):
+    def test_n_exercises(self):
+        exercises_lst = list(generate_exercises(n=25, difficulty=3, master_seed=1, max_workers=2, chunk_size=10))
+        self.assertEqual(len(exercises_lst), 25)
+        for inst in exercises_lst:
+            self.assertIsInstance(inst, SolveForXLinear)
+            self.assertEqual(inst.difficulty, 3)
+
+    def test_same_output_regardless_of_workers(self):
+        kwargs = dict(n=60, difficulty=3, master_seed=123, chunk_size=7)
+        q1 = _questions(max_workers=1, **kwargs)
+        q2 = _questions(max_workers=3, **kwargs)
+        self.assertEqual(q1, q2)
+
+    def test_unordered_contains_same_exercises(self):
+        kwargs = dict(n=60, difficulty=2, master_seed=5, max_workers=2, chunk_size=7)
+        self.assertEqual(sorted(_questions(ordered=False, **kwargs)), sorted(_questions(**kwargs)))
+
+    def test_different_master_seeds(self):
+        kwargs = dict(n=30, difficulty=3, max_workers=2)
+        self.assertNotEqual(_questions(master_seed=1, **kwargs), _questions(master_seed=2, **kwargs))
+
+    def test_early_exit_doesnt_wait_for_remaining_chunks(self):
+        for ordered in (True, False):
+            gen = generate_exercises(n=200000, difficulty=3, master_seed=1, max_workers=2, ordered=ordered)
+            next(gen)
+            t = time.perf_counter()
+            gen.close()
+            self.assertLess(time.perf_counter() - t, 1)
+
+    def test_disallowed_args(self):
+        self.assertRaises(ValueError, list, generate_exercises(n=5, difficulty=1, x_terms=5))
@@ -2,7 +2,7 @@ from unittest import TestCase
 from random import randint
 
 from tests import REPETITIONS
-from arbitrary_pieces import r_int, _ALLOWED_POS_NEG_0
+from arbitrary_pieces import r_int, r_ints, int_sampler, _ALLOWED_POS_NEG_0
 
 
 class Test_r_int(TestCase):
@@ -101,3 +101,64 @@ class Test_r_int(TestCase):
     def test_non_positive_weight(self):
         self.assertRaises(ValueError, r_int, 5, weights={1: 0})
         self.assertRaises(ValueError, r_int, 5, weights={1: -4})
+
+
+class Test_r_int_rng(TestCase):
+    def test_same_seed_same_ints(self):
+        import random
+        l1 = [r_int(100, rng=random.Random(3)) for _ in range(10)]
+        l2 = [r_int(100, rng=random.Random(3)) for _ in range(10)]
+        self.assertEqual(l1, l2)
+
+    def test_numpy_generator(self):
+        import numpy
+        rng = numpy.random.default_rng(1)
+        for _ in range(REPETITIONS // 10):
+            n = r_int(5, '-', rng=rng)
+            self.assertIsInstance(n, int)
+            self.assertTrue(-5 <= n < 0)
+
+
+class Test_r_ints(TestCase):
+    def test_k_ints_within_bounds(self):
+        for _ in range(REPETITIONS // 10):
+            k = randint(0, 10)
+            nums = r_ints(k, 5, '+')
+            self.assertEqual(len(nums), k)
+            for n in nums:
+                self.assertTrue(0 < n <= 5)
+
+    def test_numpy_generator(self):
+        import numpy
+        nums = r_ints(100, (2, 3), excluded={3}, rng=numpy.random.default_rng(1))
+        self.assertEqual(set(nums), {2})
+
+    def test_weight_effect_on_odds(self):
+        weight_1 = 3
+        nums_lst = r_ints(REPETITIONS, (0, 2), weights={1: weight_1})
+        ratio_1 = nums_lst.count(1) / len(nums_lst)
+        self.assertAlmostEqual(weight_1 / (1+weight_1+1), ratio_1, delta=.02)
+
+    def test_invalid_args(self):
+        self.assertRaises(ValueError, r_ints, 3, (3, 6), '-')
+        self.assertRaises(ValueError, r_ints, 3, 5, weights={1: 0})
+
+
+class Test_int_sampler(TestCase):
+    def test_cached(self):
+        self.assertIs(int_sampler(10, '-+', {3}, {1: 2}), int_sampler(10, '-+', [3], {1: 2}))
+
+    def test_candidates_and_weights(self):
+        sampler = int_sampler((-2, 3), '-+', excluded={2}, weights={1: 3})
+        self.assertEqual(sampler.candidates, (-2, -1, 1, 3))
+        self.assertEqual(sampler.weights, (1, 1, 3, 1))
+
+    def test_sample(self):
+        sampler = int_sampler(4, '+')
+        nums = sampler.sample(REPETITIONS)
+        self.assertEqual(len(nums), REPETITIONS)
+        self.assertEqual(set(nums), {1, 2, 3, 4})
+
+    def test_invalid_args_not_cached(self):
+        for _ in range(3):
+            self.assertRaises(ValueError, int_sampler, (3, 6), '-')
@@ -32,3 +32,9 @@ class Test_sometimes_replace_1x_with_x(TestCase):
             num1x_expr = '{}.1x'.format(randint(1, 100))
             final_expr = sometimes_replace_1x_with_x(num1x_expr, var_name='x')
             self.assertEqual(num1x_expr, final_expr)
+
+    def test_same_seed_same_result(self):
+        import random
+        for seed in range(20):
+            self.assertEqual(sometimes_replace_1x_with_x('1x+2', 'x', rng=random.Random(seed)),
+                             sometimes_replace_1x_with_x('1x+2', 'x', rng=random.Random(seed)))
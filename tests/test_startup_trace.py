@@ -0,0 +1,28 @@
+from unittest import TestCase
+
+import startup_trace
+
+
+class Test_startup_trace(TestCase):
+    def setUp(self):
+        self.marks = list(startup_trace.MARKS)
+        del startup_trace.MARKS[:]
+
+    def tearDown(self):
+        startup_trace.MARKS[:] = self.marks
+
+    def test_marks_in_order(self):
+        startup_trace.mark('imports')
+        startup_trace.mark('first frame')
+        names = [name for name, _ in startup_trace.MARKS]
+        times = [t for _, t in startup_trace.MARKS]
+        self.assertEqual(names, ['imports', 'first frame'])
+        self.assertEqual(times, sorted(times))
+
+    def test_report(self):
+        startup_trace.mark('imports')
+        startup_trace.mark('first frame')
+        lines = startup_trace.report().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[1].startswith('first frame'))
+        self.assertIn(' ms (+', lines[1])
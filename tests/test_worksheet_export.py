@@ -0,0 +1,78 @@
+import csv
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+import exercises
+from worksheet_export import export
+
+
+class Test_stream(TestCase):
+    def test_same_seed_same_exercises(self):
+        s1, s2 = exercises.stream(difficulty=3, seed=2), exercises.stream(difficulty=3, seed=2)
+        for _ in range(20):
+            self.assertEqual(next(s1).question, next(s2).question)
+
+    def test_records_same_as_exercises(self):
+        s1 = exercises.stream(difficulty=3, seed=5, x_terms=2, non_x_terms=4)
+        s2 = exercises.stream(difficulty=3, seed=5, x_terms=2, non_x_terms=4, records=True)
+        for _ in range(20):
+            r = next(s2)
+            self.assertIsInstance(r, exercises.SolveForXLinearRecord)
+            self.assertEqual(next(s1).question, r.question)
+
+    def test_records_ignore_display_class(self):
+        s1 = exercises.stream(difficulty=2, seed=3, var_name='y', display_class='fill_gaps')
+        s2 = exercises.stream(difficulty=2, seed=3, var_name='y', display_class='fill_gaps', records=True)
+        for _ in range(10):
+            self.assertEqual(next(s1).question, next(s2).question)
+
+    def test_disallowed_args(self):
+        self.assertRaises(ValueError, next, exercises.stream(difficulty=4))
+        self.assertRaises(ValueError, next, exercises.stream(difficulty=1, x_terms=5, records=True))
+
+
+class Test_export(TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self.dir.name, name)
+
+    def test_csv(self):
+        path = self._path('w.csv')
+        self.assertEqual(export(exercises.stream(difficulty=2, seed=1), path, n=25, chunk_size=10), 25)
+        with open(path) as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0], ['question', 'answers'])
+        self.assertEqual(len(rows), 26)
+        expected = [inst.question for inst, _ in zip(exercises.stream(difficulty=2, seed=1), range(25))]
+        self.assertEqual([r[0] for r in rows[1:]], expected)
+
+    def test_jsonl(self):
+        path = self._path('w.jsonl')
+        export(exercises.stream(difficulty=1, seed=1, records=True), path, n=7, chunk_size=3)
+        with open(path) as f:
+            lines = [json.loads(l) for l in f]
+        self.assertEqual(len(lines), 7)
+        for d in lines:
+            self.assertEqual(set(d), {'question', 'question_in_latex', 'answers'})
+
+    def test_tex(self):
+        path = self._path('w.tex')
+        export(exercises.stream(difficulty=2, seed=1, records=True), path, n=5)
+        with open(path) as f:
+            text = f.read()
+        self.assertEqual(text.count('\\item'), 5)
+        self.assertTrue(text.rstrip().endswith('\\end{document}'))
+
+    def test_finite_iterable(self):
+        path = self._path('w.csv')
+        self.assertEqual(export([exercises.SolveForXLinear()] * 3, path, n=10), 3)
+
+    def test_unsupported_format(self):
+        self.assertRaises(ValueError, export, [], self._path('w.txt'), n=1)
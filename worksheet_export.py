@@ -0,0 +1,96 @@
+"""
+Writes exercises (eg. from `exercises.stream`) to CSV, JSON-lines or LaTeX worksheet files.
+
+Exercises are pulled from the iterable only as fast as they are written,
+and written in chunks, so memory doesn't grow with the number of exercises.
+
+Example:
+>>> export(exercises.stream(difficulty=3, seed=1, records=True), 'worksheet.tex', n=10**6)
+"""
+
+
+import csv
+import io
+import itertools
+import json
+import os
+
+from arbitrary_pieces import SPECIAL_ANSWERS_TYPES
+
+
+DEFAULT_CHUNK_SIZE = 1000
+
+_LATEX_HEADER = '\\documentclass{article}\n\\begin{document}\n\\begin{enumerate}\n'
+_LATEX_FOOTER = '\\end{enumerate}\n\\end{document}\n'
+
+
+def answer_str(ans_val):
+    """eg. '-1/2', 'AnyNumber'"""
+    if ans_val in SPECIAL_ANSWERS_TYPES:
+        return ans_val.__name__
+    return str(ans_val)
+
+
+def _answers_str(expected_answers):
+    """eg. 'x=-1/2'"""
+    return '; '.join('{}={}'.format(name, answer_str(val)) for name, val in sorted(expected_answers.items()))
+
+
+def _csv_chunk(exercises_chunk):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    for e in exercises_chunk:
+        writer.writerow([e.question, _answers_str(e.expected_answers)])
+    return buffer.getvalue()
+
+
+def _jsonl_chunk(exercises_chunk):
+    lines = []
+    for e in exercises_chunk:
+        d = {'question': e.question,
+             'question_in_latex': e.question_in_latex,
+             'answers': {name: answer_str(val) for name, val in e.expected_answers.items()}}
+        lines.append(json.dumps(d, ensure_ascii=False) + '\n')
+    return ''.join(lines)
+
+
+def _latex_chunk(exercises_chunk):
+    return ''.join('\\item {} \\hfill ({})\n'.format(e.question_in_latex, _answers_str(e.expected_answers))
+                   for e in exercises_chunk)
+
+
+# format: (header, chunk-function, footer)
+FORMATS = {
+    'csv': ('question,answers\n', _csv_chunk, ''),
+    'jsonl': ('', _jsonl_chunk, ''),
+    'tex': (_LATEX_HEADER, _latex_chunk, _LATEX_FOOTER),
+}
+
+
+def export(exercises_iter, path, n, fmt=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Writes the first `n` exercises of `exercises_iter` to `path`.
+
+    :param exercises_iter: Exercises or records (anything with `question`,
+        `question_in_latex` and `expected_answers`), eg. `exercises.stream(..)`.
+    :param fmt: 'csv', 'jsonl' or 'tex' (defaults to the extension of `path`).
+    :param chunk_size: Number of exercises held in memory and written at once.
+    :return: (int) Number of exercises written.
+    """
+    fmt = fmt or os.path.splitext(path)[1].lstrip('.')
+    if fmt not in FORMATS:
+        raise ValueError('Format {} not supported. Supported: {}.'.format(fmt, sorted(FORMATS)))
+    header, chunk_func, footer = FORMATS[fmt]
+
+    exercises_iter = iter(exercises_iter)
+    written = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(header)
+        while written < n:
+            chunk = list(itertools.islice(exercises_iter, min(chunk_size, n - written)))
+            if not chunk:
+                break
+            f.write(chunk_func(chunk))
+            written += len(chunk)
+        f.write(footer)
+    return written